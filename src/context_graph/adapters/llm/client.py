@@ -24,7 +24,8 @@ from context_graph.domain.extraction import (
     ExtractedSkill,
     SessionExtractionResult,
     apply_confidence_prior,
-    validate_source_quote,
+    normalize_conversation,
+    quote_in_conversation,
 )
 
 if TYPE_CHECKING:
@@ -282,9 +283,11 @@ def validate_extraction(
     adjusted confidence falls below the threshold for their source type
     are also dropped.
     """
+    conversation = normalize_conversation(conversation_text)
+
     valid_entities = []
     for entity in result.entities:
-        if validate_source_quote(entity.source_quote, conversation_text):
+        if quote_in_conversation(entity.source_quote, conversation):
             valid_entities.append(entity)
         else:
             log.debug(
@@ -295,7 +298,7 @@ def validate_extraction(
 
     valid_preferences = []
     for pref in result.preferences:
-        if not validate_source_quote(pref.source_quote, conversation_text):
+        if not quote_in_conversation(pref.source_quote, conversation):
             log.debug(
                 "preference_source_quote_invalid",
                 key=pref.key,
@@ -317,7 +320,7 @@ def validate_extraction(
 
     valid_skills = []
     for skill in result.skills:
-        if not validate_source_quote(skill.source_quote, conversation_text):
+        if not quote_in_conversation(skill.source_quote, conversation):
             log.debug(
                 "skill_source_quote_invalid",
                 name=skill.name,
@@ -339,7 +342,7 @@ def validate_extraction(
 
     valid_interests = []
     for interest in result.interests:
-        if not validate_source_quote(interest.source_quote, conversation_text):
+        if not quote_in_conversation(interest.source_quote, conversation):
             log.debug(
                 "interest_source_quote_invalid",
                 entity_name=interest.entity_name,
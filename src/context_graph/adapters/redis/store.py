@@ -293,9 +293,8 @@ class RedisEventStore:
         if raw is None:
             return None
 
-        raw_str = raw.decode() if isinstance(raw, bytes) else raw
         # JSON.GET with $ path returns a JSON array
-        parsed = orjson.loads(raw_str)
+        parsed = orjson.loads(raw)
         doc = parsed[0] if isinstance(parsed, list) and len(parsed) > 0 else parsed
         doc.pop("occurred_at_epoch_ms", None)
         return Event.model_validate(doc, strict=False)
@@ -331,7 +331,7 @@ async def replay(
         )
 
     from context_graph.domain.models import EventQuery
-    from context_graph.domain.projection import project_event
+    from context_graph.domain.projection import iter_project_events
 
     logger.warning("replay_started")
 
@@ -355,9 +355,7 @@ async def replay(
         if not events:
             break
 
-        for event in events:
-            projection = project_event(event, prev_event)
-
+        for projection in iter_project_events(events, prev_event):
             await graph_store.merge_event_node(projection.node)
             nodes_created += 1
 
@@ -366,7 +364,7 @@ async def replay(
                 edges_created += 1
 
             events_replayed += 1
-            prev_event = event
+        prev_event = events[-1]
 
         if len(events) < batch_size:
             break
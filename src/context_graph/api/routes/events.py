@@ -13,6 +13,7 @@ coercion and then run domain validation on the coerced model.
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from typing import Annotated, Any
 
 import structlog
@@ -164,6 +165,7 @@ async def ingest_event_batch(
     errors: list[dict[str, Any]] = []
     valid_events: list[Event] = []
     valid_payloads: list[dict[str, Any] | None] = []
+    received_at = datetime.now(UTC)
 
     for idx, raw_event in enumerate(raw_events):
         # Extract payload before Pydantic parsing
@@ -193,7 +195,7 @@ async def ingest_event_batch(
             continue
 
         # Domain validation
-        validation_result = validate_event(event)
+        validation_result = validate_event(event, now=received_at)
         if validation_result.is_valid:
             valid_events.append(event)
             valid_payloads.append(event_payload)
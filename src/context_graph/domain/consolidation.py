@@ -14,7 +14,7 @@ Source: ADR-0008
 from __future__ import annotations
 
 import hashlib
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from context_graph.domain.models import RetentionTier, SummaryNode
@@ -23,6 +23,15 @@ if TYPE_CHECKING:
     from context_graph.settings import RetentionSettings
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _parse_dt(raw: str | datetime) -> datetime:
+    if isinstance(raw, datetime):
+        return raw
+    return datetime.fromisoformat(raw)
+
+
 def should_reconsolidate(importance_sum: float, threshold: float = 150.0) -> bool:
     """Check whether a session's importance sum exceeds the reflection threshold.
 
@@ -47,25 +56,21 @@ def group_events_into_episodes(
     if not events:
         return []
 
-    def _parse_dt(raw: str | datetime) -> datetime:
-        if isinstance(raw, datetime):
-            return raw
-        return datetime.fromisoformat(raw)
+    # Parse each timestamp exactly once, then sort and scan on the parsed values.
+    timestamps = [_parse_dt(event["occurred_at"]) for event in events]
+    order = sorted(range(len(events)), key=timestamps.__getitem__)
+    gap = timedelta(minutes=gap_minutes)
 
-    sorted_events = sorted(events, key=lambda e: _parse_dt(e["occurred_at"]))
-    gap_seconds = gap_minutes * 60
+    episodes: list[list[dict[str, Any]]] = [[events[order[0]]]]
+    prev_dt = timestamps[order[0]]
 
-    episodes: list[list[dict[str, Any]]] = [[sorted_events[0]]]
-
-    for event in sorted_events[1:]:
-        prev_dt = _parse_dt(episodes[-1][-1]["occurred_at"])
-        curr_dt = _parse_dt(event["occurred_at"])
-        delta = (curr_dt - prev_dt).total_seconds()
-
-        if delta > gap_seconds:
-            episodes.append([event])
+    for idx in order[1:]:
+        curr_dt = timestamps[idx]
+        if curr_dt - prev_dt > gap:
+            episodes.append([events[idx]])
         else:
-            episodes[-1].append(event)
+            episodes[-1].append(events[idx])
+        prev_dt = curr_dt
 
     return episodes
 
@@ -85,11 +90,6 @@ def create_summary_from_events(
         msg = "Cannot create summary from empty event list"
         raise ValueError(msg)
 
-    def _parse_dt(raw: str | datetime) -> datetime:
-        if isinstance(raw, datetime):
-            return raw
-        return datetime.fromisoformat(raw)
-
     event_ids = sorted(e.get("event_id", "") for e in events)
     id_hash = hashlib.sha256("|".join(event_ids).encode()).hexdigest()[:12]
     summary_id = f"summary-{scope_id}-{id_hash}"
@@ -127,14 +127,12 @@ def build_summary_prompt(episode_events: list[dict[str, Any]]) -> str:
     includes structured event data for the model to summarize.
     """
 
-    def _parse_dt(raw: str | datetime) -> datetime:
-        if isinstance(raw, datetime):
-            return raw
-        return datetime.fromisoformat(raw)
-
+    # sorted() evaluates the key once per event. Timestamps are compared as
+    # datetimes rather than raw strings so mixed UTC offsets still order
+    # chronologically.
     sorted_events = sorted(
         episode_events,
-        key=lambda e: _parse_dt(e.get("occurred_at", "1970-01-01T00:00:00+00:00")),
+        key=lambda e: _parse_dt(e["occurred_at"]) if "occurred_at" in e else _EPOCH,
     )
 
     lines = [
@@ -176,33 +174,34 @@ def select_events_for_pruning(
     if tier == RetentionTier.HOT:
         return []
 
-    prune_ids: list[str] = []
-
-    for event in events:
-        event_id = event.get("event_id", "")
-        if not event_id:
-            continue
-
-        if tier == RetentionTier.WARM:
-            # In warm tier, we prune events that have low-quality
-            # SIMILAR_TO connections (the similarity score is on the edge,
-            # but for event-level pruning we check importance/access).
-            # Events with very low importance and no access get pruned.
-            importance = event.get("importance_score") or 0
-            access_count = event.get("access_count", 0)
-            if importance < retention.cold_min_importance and access_count == 0:
-                prune_ids.append(event_id)
-
-        elif tier == RetentionTier.COLD:
-            importance = event.get("importance_score") or 0
-            access_count = event.get("access_count", 0)
-            if (
-                importance < retention.cold_min_importance
-                and access_count < retention.cold_min_access_count
-            ):
-                prune_ids.append(event_id)
-
-        elif tier == RetentionTier.ARCHIVE:
-            prune_ids.append(event_id)
-
-    return prune_ids
+    # The tier and thresholds are fixed for the whole batch, so dispatch once
+    # and run a single comprehension instead of re-checking the tier per event.
+    if tier == RetentionTier.ARCHIVE:
+        return [event_id for event in events if (event_id := event.get("event_id", ""))]
+
+    min_importance = retention.cold_min_importance
+
+    if tier == RetentionTier.WARM:
+        # In warm tier, we prune events that have low-quality
+        # SIMILAR_TO connections (the similarity score is on the edge,
+        # but for event-level pruning we check importance/access).
+        # Events with very low importance and no access get pruned.
+        return [
+            event_id
+            for event in events
+            if (event_id := event.get("event_id", ""))
+            and (event.get("importance_score") or 0) < min_importance
+            and event.get("access_count", 0) == 0
+        ]
+
+    if tier == RetentionTier.COLD:
+        min_access_count = retention.cold_min_access_count
+        return [
+            event_id
+            for event in events
+            if (event_id := event.get("event_id", ""))
+            and (event.get("importance_score") or 0) < min_importance
+            and event.get("access_count", 0) < min_access_count
+        ]
+
+    return []
@@ -5,26 +5,42 @@ resolution for entities extracted from conversation sessions.  Results map
 to MERGE / SAME_AS / RELATED_TO / CREATE actions in the Neo4j graph projection.
 
 Tier 1:  Exact match (normalization + alias dict)
-Tier 2a: Fuzzy match (SequenceMatcher >= 0.9)
+Tier 2a: Fuzzy match (normalized edit-distance ratio >= 0.9)
 Tier 2b: Semantic match (embedding cosine similarity)
 
-Pure Python + stdlib — ZERO framework imports.
+Pure Python — ZERO framework imports.  Fuzzy scoring uses the ``rapidfuzz``
+Indel ratio in every install, so match decisions do not depend on which
+optional extras are present.
 """
 
 from __future__ import annotations
 
 import enum
 from dataclasses import dataclass
-from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Any
 
+from rapidfuzz.fuzz import ratio as _rapidfuzz_ratio
+from rapidfuzz.process import extractOne as _rapidfuzz_extract_one  # noqa: N813
+
+
+def _similarity_ratio(norm_a: str, norm_b: str) -> float:
+    """Similarity in [0.0, 1.0] between two already-normalized names."""
+    return float(_rapidfuzz_ratio(norm_a, norm_b)) / 100.0
+
+
 # ---------------------------------------------------------------------------
 # Normalization helpers
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=8192)
 def normalize_entity_name(name: str) -> str:
-    """Lowercase, strip leading/trailing whitespace, collapse internal spaces."""
+    """Lowercase, strip leading/trailing whitespace, collapse internal spaces.
+
+    Memoized: a single resolution pass normalizes the same candidate names
+    many times over.
+    """
     return " ".join(name.lower().split())
 
 
@@ -52,15 +68,30 @@ DOMAIN_ALIAS_DICT: dict[str, list[str]] = {
     "csv": ["comma separated values", "comma-separated values"],
 }
 
-# Build reverse lookup: alias -> canonical name
-_ALIAS_TO_CANONICAL: dict[str, str] = {}
-for _canonical, _aliases in DOMAIN_ALIAS_DICT.items():
-    for _alias in _aliases:
-        _ALIAS_TO_CANONICAL[_alias.lower()] = _canonical
+# Build reverse lookup once at import: normalized alias -> canonical name.
+# Keys go through the same normalization as lookups so resolve_alias is a
+# single dict probe.
+_ALIAS_TO_CANONICAL: dict[str, str] = {
+    normalize_entity_name(alias): canonical
+    for canonical, aliases in DOMAIN_ALIAS_DICT.items()
+    for alias in aliases
+}
+
+
+_CANONICAL_NAMES: frozenset[str] = frozenset(
+    normalize_entity_name(canonical) for canonical in DOMAIN_ALIAS_DICT
+)
 
 
 def resolve_alias(name: str) -> str:
     """Return canonical name if *name* is a known alias, otherwise return normalized name."""
+    # Fast path: names that are already a normalized alias or canonical
+    # (the common case for extracted entities) skip normalization entirely.
+    canonical = _ALIAS_TO_CANONICAL.get(name)
+    if canonical is not None:
+        return canonical
+    if name in _CANONICAL_NAMES:
+        return name
     normalized = normalize_entity_name(name)
     return _ALIAS_TO_CANONICAL.get(normalized, normalized)
 
@@ -79,7 +110,7 @@ class EntityResolutionAction(enum.StrEnum):
     CREATE = "CREATE"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EntityResolutionResult:
     """Outcome of an entity resolution attempt."""
 
@@ -95,42 +126,72 @@ class EntityResolutionResult:
 # ---------------------------------------------------------------------------
 
 
+EntityIndex = dict[str, list[dict[str, Any]]]
+"""Existing entities bucketed by normalized name and by resolved alias."""
+
+
+def add_to_entity_index(index: EntityIndex, entity: dict[str, Any]) -> None:
+    """Register *entity* under its normalized name and its canonical alias."""
+    raw_name = entity.get("name", "")
+    for key in {normalize_entity_name(raw_name), resolve_alias(raw_name)}:
+        index.setdefault(key, []).append(entity)
+
+
+def build_entity_index(existing_entities: list[dict[str, Any]]) -> EntityIndex:
+    """Build an exact-match index over ``existing_entities``.
+
+    Buckets keep the input order, so a lookup returns the same entity a
+    linear scan of the list would have found first.
+    """
+    index: EntityIndex = {}
+    for entity in existing_entities:
+        add_to_entity_index(index, entity)
+    return index
+
+
 def resolve_exact_match(
     name: str,
     entity_type: str,
-    existing_entities: list[dict[str, Any]],
+    existing_entities: list[dict[str, Any]] | EntityIndex,
 ) -> EntityResolutionResult | None:
     """Tier 1: Normalize, resolve aliases, and look for an exact name match.
 
-    ``existing_entities`` is a list of dicts with at least ``name`` and
-    ``entity_type`` keys.
+    ``existing_entities`` is either a list of dicts with at least ``name``
+    and ``entity_type`` keys, or an index from :func:`build_entity_index`.
+    Callers resolving many names against the same entities should pass the
+    index so candidates are not re-normalized on every call.
 
     Returns ``None`` if no exact match is found.
     """
+    if isinstance(existing_entities, dict):
+        index = existing_entities
+    else:
+        index = build_entity_index(existing_entities)
+
     canonical = resolve_alias(name)
-    for entity in existing_entities:
-        existing_name = normalize_entity_name(entity.get("name", ""))
-        existing_alias = resolve_alias(entity.get("name", ""))
-        if canonical in (existing_name, existing_alias):
-            if entity.get("entity_type", "") == entity_type:
-                return EntityResolutionResult(
-                    action=EntityResolutionAction.MERGE,
-                    canonical_name=existing_name if canonical == existing_name else existing_alias,
-                    entity_type=entity_type,
-                    confidence=1.0,
-                    justification=f"Exact match after normalization: '{canonical}'",
-                )
-            return EntityResolutionResult(
-                action=EntityResolutionAction.SAME_AS,
-                canonical_name=existing_name if canonical == existing_name else existing_alias,
-                entity_type=entity.get("entity_type", entity_type),
-                confidence=0.9,
-                justification=(
-                    f"Exact name match '{canonical}' but type differs "
-                    f"({entity_type} vs {entity.get('entity_type')})"
-                ),
-            )
-    return None
+    matches = index.get(canonical)
+    if not matches:
+        return None
+
+    entity = matches[0]
+    if entity.get("entity_type", "") == entity_type:
+        return EntityResolutionResult(
+            action=EntityResolutionAction.MERGE,
+            canonical_name=canonical,
+            entity_type=entity_type,
+            confidence=1.0,
+            justification=f"Exact match after normalization: '{canonical}'",
+        )
+    return EntityResolutionResult(
+        action=EntityResolutionAction.SAME_AS,
+        canonical_name=canonical,
+        entity_type=entity.get("entity_type", entity_type),
+        confidence=0.9,
+        justification=(
+            f"Exact name match '{canonical}' but type differs "
+            f"({entity_type} vs {entity.get('entity_type')})"
+        ),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -139,7 +200,7 @@ def resolve_exact_match(
 
 
 def compute_name_similarity(name_a: str, name_b: str) -> float:
-    """Character-level similarity between two names using SequenceMatcher.
+    """Character-level similarity between two names.
 
     Both names are normalized before comparison.  Returns a value in [0.0, 1.0].
     """
@@ -147,55 +208,100 @@ def compute_name_similarity(name_a: str, name_b: str) -> float:
     norm_b = normalize_entity_name(name_b)
     if not norm_a or not norm_b:
         return 0.0
-    return SequenceMatcher(None, norm_a, norm_b).ratio()
+    return _similarity_ratio(norm_a, norm_b)
 
 
-def resolve_close_match(
-    name: str,
-    entity_type: str,
+def _best_candidate(
+    query_forms: list[str],
+    candidate_forms: list[str],
+    candidate_owners: list[int],
+) -> tuple[int, float] | None:
+    """Return ``(entity position, score)`` of the best-scoring candidate form.
+
+    Ties keep the earliest entity, matching a first-wins linear scan.
+    """
+    best: tuple[int, float] | None = None
+    for query in query_forms:
+        hit = _rapidfuzz_extract_one(
+            query, candidate_forms, scorer=_rapidfuzz_ratio, processor=None
+        )
+        if hit is None:
+            continue
+        owner, score = candidate_owners[hit[2]], float(hit[1]) / 100.0
+        if best is None or score > best[1] or (score == best[1] and owner < best[0]):
+            best = (owner, score)
+    return best
+
+
+def resolve_close_match_batch(
+    queries: list[tuple[str, str]],
     existing_entities: list[dict[str, Any]],
     threshold: float = 0.9,
-) -> EntityResolutionResult | None:
-    """Tier 2: Fuzzy name match above *threshold*.
+) -> list[EntityResolutionResult | None]:
+    """Tier 2 for many ``(name, entity_type)`` queries against one entity set.
 
-    Iterates ``existing_entities`` and returns the best match with similarity
-    >= *threshold*.  Returns ``None`` if no entity exceeds the threshold.
+    Candidate names are normalized and alias-resolved once for the whole
+    batch instead of once per query.  Returns one result (or ``None``) per
+    query, in input order.
     """
-    canonical = resolve_alias(name)
-    normalized = normalize_entity_name(name)
-    best_score = 0.0
-    best_entity: dict[str, Any] | None = None
-
-    for entity in existing_entities:
-        existing_raw = normalize_entity_name(entity.get("name", ""))
-        existing_canonical = resolve_alias(entity.get("name", ""))
+    candidate_forms: list[str] = []
+    candidate_owners: list[int] = []
+    candidate_canonicals: list[str] = []
+    for position, entity in enumerate(existing_entities):
+        raw_name = entity.get("name", "")
+        existing_raw = normalize_entity_name(raw_name)
+        existing_canonical = resolve_alias(raw_name)
+        candidate_canonicals.append(existing_canonical)
+        for form in dict.fromkeys((existing_raw, existing_canonical)):
+            if form:
+                candidate_forms.append(form)
+                candidate_owners.append(position)
+
+    results: list[EntityResolutionResult | None] = []
+    for name, entity_type in queries:
+        canonical = resolve_alias(name)
+        normalized = normalize_entity_name(name)
+        query_forms = [form for form in dict.fromkeys((canonical, normalized)) if form]
         # Compare against both aliased and raw forms, taking the best
-        score = max(
-            compute_name_similarity(canonical, existing_canonical),
-            compute_name_similarity(normalized, existing_raw),
-            compute_name_similarity(canonical, existing_raw),
-            compute_name_similarity(normalized, existing_canonical),
-        )
-        if score > best_score:
-            best_score = score
-            best_entity = entity
+        best = _best_candidate(query_forms, candidate_forms, candidate_owners)
+        if best is None or best[1] <= 0.0 or best[1] < threshold:
+            results.append(None)
+            continue
 
-    if best_entity is not None and best_score >= threshold:
-        existing_canonical = resolve_alias(best_entity.get("name", ""))
+        position, best_score = best
+        best_entity = existing_entities[position]
+        existing_canonical = candidate_canonicals[position]
         if best_entity.get("entity_type", "") == entity_type:
             action = EntityResolutionAction.SAME_AS
         else:
             action = EntityResolutionAction.RELATED_TO
-        return EntityResolutionResult(
-            action=action,
-            canonical_name=existing_canonical,
-            entity_type=best_entity.get("entity_type", entity_type),
-            confidence=round(best_score, 4),
-            justification=(
-                f"Fuzzy match '{canonical}' ~ '{existing_canonical}' (similarity={best_score:.4f})"
-            ),
+        results.append(
+            EntityResolutionResult(
+                action=action,
+                canonical_name=existing_canonical,
+                entity_type=best_entity.get("entity_type", entity_type),
+                confidence=round(best_score, 4),
+                justification=(
+                    f"Fuzzy match '{canonical}' ~ '{existing_canonical}' "
+                    f"(similarity={best_score:.4f})"
+                ),
+            )
         )
-    return None
+    return results
+
+
+def resolve_close_match(
+    name: str,
+    entity_type: str,
+    existing_entities: list[dict[str, Any]],
+    threshold: float = 0.9,
+) -> EntityResolutionResult | None:
+    """Tier 2: Fuzzy name match above *threshold*.
+
+    Scores ``existing_entities`` and returns the best match with similarity
+    >= *threshold*.  Returns ``None`` if no entity exceeds the threshold.
+    """
+    return resolve_close_match_batch([(name, entity_type)], existing_entities, threshold)[0]
 
 
 # ---------------------------------------------------------------------------
@@ -203,7 +309,7 @@ def resolve_close_match(
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SemanticCandidate:
     """A candidate entity returned by vector similarity search.
 
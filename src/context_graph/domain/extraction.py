@@ -10,11 +10,14 @@ Pure Python + Pydantic v2 — ZERO framework imports.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from difflib import SequenceMatcher
 from typing import Literal
 
 from pydantic import BaseModel, Field
 
+_QUOTE_MATCH_THRESHOLD = 0.6
+
 # ---------------------------------------------------------------------------
 # Confidence ceiling by source type (ADR-0013 section 7)
 # ---------------------------------------------------------------------------
@@ -29,6 +32,9 @@ CONFIDENCE_CEILINGS: dict[str, float] = {
     "implicit": 0.7,
 }
 
+# Bound once: apply_confidence_prior runs for every extracted item.
+_CEILING_GET = CONFIDENCE_CEILINGS.get
+
 
 def apply_confidence_prior(extraction_confidence: float, source_type: str) -> float:
     """Apply source-type confidence ceilings.
@@ -36,12 +42,31 @@ def apply_confidence_prior(extraction_confidence: float, source_type: str) -> fl
     Returns the minimum of ``extraction_confidence`` and the ceiling for
     ``source_type``. Unknown source types pass through unmodified.
     """
-    ceiling = CONFIDENCE_CEILINGS.get(source_type)
+    ceiling = _CEILING_GET(source_type)
     if ceiling is None:
         return extraction_confidence
     return min(extraction_confidence, ceiling)
 
 
+def _normalize_text(text: str) -> str:
+    """Lowercase *text* and collapse runs of whitespace to single spaces."""
+    return " ".join(text.lower().split())
+
+
+@dataclass(slots=True, frozen=True)
+class NormalizedConversation:
+    """Conversation text prepared once for checking many source quotes."""
+
+    text: str
+    words: frozenset[str]
+
+
+def normalize_conversation(conversation_text: str) -> NormalizedConversation:
+    """Normalize *conversation_text* and collect its distinct words."""
+    text = _normalize_text(conversation_text)
+    return NormalizedConversation(text=text, words=frozenset(text.split()))
+
+
 def validate_source_quote(quote: str, conversation_text: str) -> bool:
     """Fuzzy substring check — does *quote* appear (approximately) in *conversation_text*?
 
@@ -50,12 +75,23 @@ def validate_source_quote(quote: str, conversation_text: str) -> bool:
     best matching window is considered a match.  The threshold is kept
     deliberately low because LLMs frequently paraphrase or truncate quotes
     while still capturing the correct evidence.
+
+    Callers checking several quotes against one conversation should
+    normalize it once with :func:`normalize_conversation` and call
+    :func:`quote_in_conversation` instead.
     """
     if not quote or not conversation_text:
         return False
+    return quote_in_conversation(quote, normalize_conversation(conversation_text))
 
-    normalized_quote = " ".join(quote.lower().split())
-    normalized_text = " ".join(conversation_text.lower().split())
+
+def quote_in_conversation(quote: str, conversation: NormalizedConversation) -> bool:
+    """:func:`validate_source_quote` against an already-normalized conversation."""
+    normalized_text = conversation.text
+    if not quote or not normalized_text:
+        return False
+
+    normalized_quote = _normalize_text(quote)
 
     # Exact substring — fast path
     if normalized_quote in normalized_text:
@@ -66,26 +102,22 @@ def validate_source_quote(quote: str, conversation_text: str) -> bool:
     # copying it verbatim.
     quote_words = {w for w in normalized_quote.split() if len(w) > 3}
     if quote_words:
-        text_words = set(normalized_text.split())
-        overlap = len(quote_words & text_words) / len(quote_words)
+        overlap = len(quote_words & conversation.words) / len(quote_words)
         if overlap >= 0.6:
             return True
 
     # Sliding-window fuzzy match for short quotes
     window_size = len(normalized_quote)
     if window_size > len(normalized_text):
-        return SequenceMatcher(None, normalized_quote, normalized_text).ratio() >= 0.6
+        ratio = SequenceMatcher(None, normalized_quote, normalized_text).ratio()
+        return ratio >= _QUOTE_MATCH_THRESHOLD
 
-    best_ratio = 0.0
     step = max(1, window_size // 4)
     for start in range(0, len(normalized_text) - window_size + 1, step):
         window = normalized_text[start : start + window_size]
-        ratio = SequenceMatcher(None, normalized_quote, window).ratio()
-        if ratio >= 0.6:
+        if SequenceMatcher(None, normalized_quote, window).ratio() >= _QUOTE_MATCH_THRESHOLD:
             return True
-        best_ratio = max(best_ratio, ratio)
-
-    return best_ratio >= 0.6
+    return False
 
 
 _NEGATION_MARKERS = frozenset(
@@ -14,13 +14,15 @@ Source: ADR-0008
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from context_graph.domain.models import RetentionTier
 
+_SECONDS_PER_HOUR = 3600
 
-@dataclass
+
+@dataclass(slots=True)
 class PruningActions:
     """Aggregated pruning decisions for a batch of events."""
 
@@ -47,13 +49,45 @@ def classify_retention_tier(
     if now is None:
         now = datetime.now(UTC)
 
-    age_hours = (now - occurred_at).total_seconds() / 3600.0
+    # One subtraction and plain number comparisons; building three timedelta
+    # cutoffs only pays off when they are shared across a batch.
+    age_seconds = (now - occurred_at).total_seconds()
+    if age_seconds < hot_hours * _SECONDS_PER_HOUR:
+        return RetentionTier.HOT
+    if age_seconds < warm_hours * _SECONDS_PER_HOUR:
+        return RetentionTier.WARM
+    if age_seconds < cold_hours * _SECONDS_PER_HOUR:
+        return RetentionTier.COLD
+    return RetentionTier.ARCHIVE
+
+
+def _tier_cutoffs(
+    now: datetime, hot_hours: int, warm_hours: int, cold_hours: int
+) -> tuple[datetime, datetime, datetime]:
+    """Return the oldest ``occurred_at`` still inside the HOT, WARM and COLD tiers."""
+    return (
+        now - timedelta(hours=hot_hours),
+        now - timedelta(hours=warm_hours),
+        now - timedelta(hours=cold_hours),
+    )
 
-    if age_hours < hot_hours:
+
+def _tier_from_cutoffs(
+    occurred_at: datetime,
+    hot_cut: datetime,
+    warm_cut: datetime,
+    cold_cut: datetime,
+) -> RetentionTier:
+    """Classify *occurred_at* against precomputed tier cutoffs.
+
+    ``age < N hours`` is equivalent to ``occurred_at > now - N hours``, so a
+    batch can compute the cutoffs once and classify with plain comparisons.
+    """
+    if occurred_at > hot_cut:
         return RetentionTier.HOT
-    if age_hours < warm_hours:
+    if occurred_at > warm_cut:
         return RetentionTier.WARM
-    if age_hours < cold_hours:
+    if occurred_at > cold_cut:
         return RetentionTier.COLD
     return RetentionTier.ARCHIVE
 
@@ -111,14 +145,26 @@ def get_pruning_actions(
     - COLD: mark low-importance/low-access nodes for deletion
     - ARCHIVE: mark event for archival (remove from graph entirely)
 
+    Events are first bucketed by tier in one pass; each bucket is then
+    filtered by its own rule, so the per-event loop only classifies.
+
     Returns a PruningActions with lists of IDs to delete/archive.
     """
     if now is None:
         now = datetime.now(UTC)
 
     actions = PruningActions()
+    hot_cut, warm_cut, cold_cut = _tier_cutoffs(now, hot_hours, warm_hours, cold_hours)
+    warm: list[tuple[str, dict[str, Any]]] = []
+    cold: list[tuple[str, dict[str, Any]]] = []
 
     for event in events:
+        # Events without an ID can never produce an action, so skip them
+        # before paying for timestamp parsing and tier classification.
+        event_id = event.get("event_id", "")
+        if not event_id:
+            continue
+
         occurred_at_raw = event.get("occurred_at")
         if occurred_at_raw is None:
             continue
@@ -128,34 +174,27 @@ def get_pruning_actions(
         else:
             occurred_at = occurred_at_raw
 
-        tier = classify_retention_tier(
-            occurred_at=occurred_at,
-            now=now,
-            hot_hours=hot_hours,
-            warm_hours=warm_hours,
-            cold_hours=cold_hours,
-        )
+        tier = _tier_from_cutoffs(occurred_at, hot_cut, warm_cut, cold_cut)
 
-        event_id = event.get("event_id", "")
-        if not event_id:
-            continue
-
-        if tier == RetentionTier.HOT:
-            continue
-
-        if tier == RetentionTier.WARM:
-            if should_prune_warm(event, warm_min_similarity=warm_min_similarity):
-                actions.delete_edges.append(event_id)
-
-        elif tier == RetentionTier.COLD:
-            if should_prune_cold(
-                event,
-                cold_min_importance=cold_min_importance,
-                cold_min_access_count=cold_min_access_count,
-            ):
-                actions.delete_nodes.append(event_id)
-
-        elif tier == RetentionTier.ARCHIVE:
+        if tier is RetentionTier.WARM:
+            warm.append((event_id, event))
+        elif tier is RetentionTier.COLD:
+            cold.append((event_id, event))
+        elif tier is RetentionTier.ARCHIVE:
             actions.archive_event_ids.append(event_id)
 
+    actions.delete_edges.extend(
+        event_id
+        for event_id, event in warm
+        if should_prune_warm(event, warm_min_similarity=warm_min_similarity)
+    )
+    actions.delete_nodes.extend(
+        event_id
+        for event_id, event in cold
+        if should_prune_cold(
+            event,
+            cold_min_importance=cold_min_importance,
+            cold_min_access_count=cold_min_access_count,
+        )
+    )
     return actions
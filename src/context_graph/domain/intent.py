@@ -10,6 +10,7 @@ Pure Python — ZERO framework imports.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 from context_graph.domain.models import IntentType
 
@@ -46,12 +47,19 @@ _INTENT_KEYWORDS: dict[str, list[str]] = {
     ],
 }
 
-# Pre-compiled regex patterns with word boundaries for each intent type.
-# Avoids substring matching (e.g., "show" matching "how") by using \b.
-_INTENT_PATTERNS: dict[str, list[re.Pattern[str]]] = {
-    intent: [re.compile(r"\b" + re.escape(kw) + r"\b") for kw in keywords]
-    for intent, keywords in _INTENT_KEYWORDS.items()
+# Single pre-compiled scanner over every keyword, with word boundaries to
+# avoid substring matching (e.g., "show" matching "how").  Longest keywords
+# come first so multi-word phrases win the alternation.  One scan finds the
+# same keyword set as per-keyword searches because no keyword occurs as a
+# whole word inside another (guarded by a unit test).
+_KEYWORD_INTENTS: dict[str, str] = {
+    kw: intent for intent, keywords in _INTENT_KEYWORDS.items() for kw in keywords
 }
+_KEYWORD_PATTERN: re.Pattern[str] = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(kw) for kw in sorted(_KEYWORD_INTENTS, key=len, reverse=True))
+    + r")\b"
+)
 
 # Maps dominant intent to seed-node selection strategy.
 _SEED_STRATEGIES: dict[str, str] = {
@@ -71,22 +79,34 @@ def classify_intent(query: str) -> dict[str, float]:
     Each intent is scored by counting keyword matches (0.4 per match, capped at 1.0).
     Scores are then normalized so the dominant intent has confidence 1.0.
     If no keywords match, returns GENERAL with confidence 0.5.
+
+    Results are memoized per query; each call returns a fresh dict, so
+    callers may mutate it.
     """
-    query_lower = query.lower()
-    scores: dict[str, float] = {}
-    for intent, _keywords in _INTENT_KEYWORDS.items():
-        matches = sum(1 for pat in _INTENT_PATTERNS[intent] if pat.search(query_lower))
-        if matches > 0:
-            scores[intent] = min(1.0, matches * 0.4)
+    return dict(_classify_intent_cached(query))
+
+
+@lru_cache(maxsize=4096)
+def _classify_intent_cached(query: str) -> tuple[tuple[str, float], ...]:
+    """Score *query* once; returned as an immutable tuple of (intent, confidence)."""
+    matched_keywords = set(_KEYWORD_PATTERN.findall(query.lower()))
+    matches: dict[str, int] = {}
+    for kw in matched_keywords:
+        intent = _KEYWORD_INTENTS[kw]
+        matches[intent] = matches.get(intent, 0) + 1
+    # Emit in _INTENT_KEYWORDS order: select_seed_strategy breaks ties by it.
+    scores: dict[str, float] = {
+        intent: min(1.0, matches[intent] * 0.4) for intent in _INTENT_KEYWORDS if intent in matches
+    }
 
     if not scores:
-        return {IntentType.GENERAL: 0.5}
+        return ((IntentType.GENERAL, 0.5),)
 
     # Normalize so the maximum score becomes 1.0
     max_score = max(scores.values())
     if max_score > 0:
         scores = {k: v / max_score for k, v in scores.items()}
-    return scores
+    return tuple(scores.items())
 
 
 def get_edge_weights(
@@ -99,10 +119,13 @@ def get_edge_weights(
     the intent confidence and accumulated into a single edge-weight dict.
     """
     edge_weights: dict[str, float] = {}
+    get_weight = edge_weights.get
     for intent, confidence in intents.items():
-        if intent in intent_weight_matrix:
-            for edge_type, weight in intent_weight_matrix[intent].items():
-                edge_weights[edge_type] = edge_weights.get(edge_type, 0.0) + confidence * weight
+        row = intent_weight_matrix.get(intent)
+        if row is None:
+            continue
+        for edge_type, weight in row.items():
+            edge_weights[edge_type] = get_weight(edge_type, 0.0) + confidence * weight
     return edge_weights
 
 
@@ -113,7 +136,7 @@ def select_seed_strategy(intents: dict[str, float]) -> str:
     """
     if not intents:
         return "general"
-    dominant = max(intents, key=lambda k: intents[k])
+    dominant = max(intents, key=intents.__getitem__)
     return _SEED_STRATEGIES.get(dominant, "general")
 
 
@@ -8,6 +8,8 @@ Pure Python — ZERO framework imports.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 
 def validate_traversal_bounds(
     max_depth: int,
@@ -38,8 +40,19 @@ def build_lineage_cypher(
     Defaults to CAUSED_BY edges. Custom edge types can be specified for
     broader lineage queries (e.g., CAUSED_BY + FOLLOWS).
     """
-    types = edge_types or ["CAUSED_BY"]
-    type_str = "|".join(types)
+    types = tuple(edge_types) if edge_types else ("CAUSED_BY",)
+    return _lineage_cypher(node_id_param, max_depth_param, max_nodes_param, types)
+
+
+@lru_cache(maxsize=128)
+def _lineage_cypher(
+    node_id_param: str,
+    max_depth_param: str,
+    max_nodes_param: str,
+    edge_types: tuple[str, ...],
+) -> str:
+    """Assemble the lineage query; cached because callers reuse a few shapes."""
+    type_str = "|".join(edge_types)
     return (
         f"MATCH path = (start:Event {{event_id: {node_id_param}}})"
         f"-[:{type_str}*1..{max_depth_param}]->(ancestor) "
@@ -49,12 +62,14 @@ def build_lineage_cypher(
     )
 
 
+_CONTEXT_CYPHER = (
+    "MATCH (e:Event {session_id: $session_id}) RETURN e ORDER BY e.occurred_at DESC LIMIT $limit"
+)
+
+
 def build_context_cypher() -> str:
     """Cypher query for session context assembly.
 
     Returns events for a session ordered by recency, limited to $limit.
     """
-    return (
-        "MATCH (e:Event {session_id: $session_id}) "
-        "RETURN e ORDER BY e.occurred_at DESC LIMIT $limit"
-    )
+    return _CONTEXT_CYPHER
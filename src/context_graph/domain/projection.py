@@ -12,10 +12,14 @@ Source: ADR-0005, ADR-0009
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import UTC
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 from context_graph.domain.models import CausalMechanism, Edge, EdgeType, Event, EventNode
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 
 @dataclass
 class ProjectionResult:
@@ -49,28 +53,24 @@ def event_to_node(event: Event) -> EventNode:
     )
 
 
-def _compute_delta_ms(earlier: Event, later: Event) -> int:
-    """Compute elapsed milliseconds between two events' occurred_at timestamps."""
-    earlier_ts = earlier.occurred_at
-    later_ts = later.occurred_at
+def _aware(ts: datetime) -> datetime:
+    """Return *ts* with UTC attached if it is naive."""
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=UTC)
 
-    # Ensure both timestamps are timezone-aware for subtraction
-    if earlier_ts.tzinfo is None:
-        earlier_ts = earlier_ts.replace(tzinfo=UTC)
-    if later_ts.tzinfo is None:
-        later_ts = later_ts.replace(tzinfo=UTC)
 
-    delta = later_ts - earlier_ts
-    return int(delta.total_seconds() * 1000)
+def _delta_ms_between(earlier_ts: datetime, later_ts: datetime) -> int:
+    """Elapsed milliseconds between two timezone-aware timestamps."""
+    return int((later_ts - earlier_ts).total_seconds() * 1000)
 
 
-def compute_follows_edge(prev_event: Event, curr_event: Event) -> Edge:
-    """Create a FOLLOWS edge between consecutive session events.
+def _compute_delta_ms(earlier: Event, later: Event) -> int:
+    """Compute elapsed milliseconds between two events' occurred_at timestamps."""
+    # Ensure both timestamps are timezone-aware for subtraction
+    return _delta_ms_between(_aware(earlier.occurred_at), _aware(later.occurred_at))
 
-    The FOLLOWS edge captures temporal ordering within a session.
-    ``delta_ms`` records the elapsed time between the two events.
-    """
-    delta_ms = _compute_delta_ms(prev_event, curr_event)
+
+def _follows_edge(prev_event: Event, curr_event: Event, delta_ms: int) -> Edge:
+    """Build the FOLLOWS edge from *curr_event* back to *prev_event*."""
     return Edge(
         source=str(curr_event.event_id),
         target=str(prev_event.event_id),
@@ -82,6 +82,15 @@ def compute_follows_edge(prev_event: Event, curr_event: Event) -> Edge:
     )
 
 
+def compute_follows_edge(prev_event: Event, curr_event: Event) -> Edge:
+    """Create a FOLLOWS edge between consecutive session events.
+
+    The FOLLOWS edge captures temporal ordering within a session.
+    ``delta_ms`` records the elapsed time between the two events.
+    """
+    return _follows_edge(prev_event, curr_event, _compute_delta_ms(prev_event, curr_event))
+
+
 def compute_caused_by_edge(event: Event) -> Edge | None:
     """Create a CAUSED_BY edge if the event has a parent_event_id.
 
@@ -121,3 +130,40 @@ def project_event(event: Event, prev_event: Event | None) -> ProjectionResult:
         edges.append(caused_by)
 
     return ProjectionResult(node=node, edges=edges)
+
+
+def iter_project_events(
+    events: Iterable[Event], prev_event: Event | None = None
+) -> Iterator[ProjectionResult]:
+    """Lazily project an ordered run of events, each following the one before it.
+
+    Yields what ``project_event`` would return for every event with the
+    previous event in the run (``prev_event`` for the first one), but each
+    timestamp is normalised once instead of once per adjacent pair. Results
+    are produced one at a time, so a caller writing them out has already
+    handled every earlier event when a later one fails to project.
+    """
+    # The previous event paired with its normalised timestamp
+    prev = (prev_event, _aware(prev_event.occurred_at)) if prev_event is not None else None
+    for event in events:
+        curr_ts = _aware(event.occurred_at)
+        node = event_to_node(event)
+        edges: list[Edge] = []
+
+        if prev is not None and prev[0].session_id == event.session_id:
+            prev_ev, prev_ts = prev
+            edges.append(_follows_edge(prev_ev, event, _delta_ms_between(prev_ts, curr_ts)))
+
+        caused_by = compute_caused_by_edge(event)
+        if caused_by is not None:
+            edges.append(caused_by)
+
+        yield ProjectionResult(node=node, edges=edges)
+        prev = (event, curr_ts)
+
+
+def project_events_batch(
+    events: Iterable[Event], prev_event: Event | None = None
+) -> list[ProjectionResult]:
+    """Project an ordered run of events into a list; see :func:`iter_project_events`."""
+    return list(iter_project_events(events, prev_event))
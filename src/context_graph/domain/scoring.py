@@ -13,6 +13,7 @@ Scoring formula:
 from __future__ import annotations
 
 import math
+import operator
 from datetime import UTC, datetime
 from typing import Any
 
@@ -84,9 +85,10 @@ def compute_relevance_score(
     """
     if not query_embedding or not node_embedding or len(query_embedding) != len(node_embedding):
         return 0.5
-    dot_product = sum(a * b for a, b in zip(query_embedding, node_embedding, strict=True))
-    norm_query = math.sqrt(sum(a * a for a in query_embedding))
-    norm_node = math.sqrt(sum(b * b for b in node_embedding))
+    # map(operator.mul) and math.hypot keep the per-element work in C.
+    dot_product = sum(map(operator.mul, query_embedding, node_embedding))
+    norm_query = math.hypot(*query_embedding)
+    norm_node = math.hypot(*node_embedding)
     if norm_query == 0.0 or norm_node == 0.0:
         return 0.5
     return max(0.0, min(1.0, dot_product / (norm_query * norm_node)))
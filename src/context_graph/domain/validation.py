@@ -9,7 +9,8 @@ Source: ADR-0004, ADR-0011 §2
 from __future__ import annotations
 
 import re
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -26,6 +27,7 @@ MAX_PAYLOAD_REF_LENGTH = 2048
 
 # Maximum time drift allowed for occurred_at (5 minutes into the future)
 MAX_FUTURE_DRIFT_SECONDS = 300
+_MAX_FUTURE_DRIFT = timedelta(seconds=MAX_FUTURE_DRIFT_SECONDS)
 
 
 class ValidationError(Exception):
@@ -51,7 +53,7 @@ class ValidationResult:
         return len(self.errors) == 0
 
 
-def validate_event(event: Event) -> ValidationResult:
+def validate_event(event: Event, now: datetime | None = None) -> ValidationResult:
     """Validate an event envelope before ingestion.
 
     Checks beyond what Pydantic's field validators enforce:
@@ -60,6 +62,9 @@ def validate_event(event: Event) -> ValidationResult:
     - parent_event_id is not self-referential
     - ended_at is after occurred_at when present
     - importance_hint is in valid range
+
+    ``now`` defaults to the current UTC time; batch callers pass one value
+    so the clock is read once per batch.
     """
     result = ValidationResult()
 
@@ -71,17 +76,21 @@ def validate_event(event: Event) -> ValidationResult:
         )
 
     # occurred_at must not be too far in the future
-    now = datetime.now(UTC)
+    if now is None:
+        now = datetime.now(UTC)
     if event.occurred_at.tzinfo is not None:
-        delta = (event.occurred_at - now).total_seconds()
-        if delta > MAX_FUTURE_DRIFT_SECONDS:
+        drift = event.occurred_at - now
+        if drift > _MAX_FUTURE_DRIFT:
             result.add_error(
                 "occurred_at",
-                f"Event timestamp is {delta:.0f}s in the future (max {MAX_FUTURE_DRIFT_SECONDS}s)",
+                f"Event timestamp is {drift.total_seconds():.0f}s in the future "
+                f"(max {MAX_FUTURE_DRIFT_SECONDS}s)",
             )
 
-    # parent_event_id must not be self-referential
-    if event.parent_event_id is not None and event.parent_event_id == event.event_id:
+    # parent_event_id must not be self-referential (compare the UUIDs' int
+    # values directly; UUID.__eq__ is a Python-level method doing the same)
+    parent_event_id = event.parent_event_id
+    if parent_event_id is not None and parent_event_id.int == event.event_id.int:
         result.add_error(
             "parent_event_id",
             "Cannot reference own event_id as parent",
@@ -104,7 +113,12 @@ def validate_event(event: Event) -> ValidationResult:
     return result
 
 
+@lru_cache(maxsize=1024)
 def validate_event_type_prefix(event_type: str) -> bool:
-    """Check if an event type has a known prefix."""
-    prefix = event_type.split(".")[0] if "." in event_type else event_type
-    return prefix in KNOWN_PREFIXES
+    """Check if an event type has a known prefix.
+
+    The prefix is everything before the first dot (the whole string when
+    there is none), checked with a single frozenset probe. Event types come
+    from a small vocabulary, so results are memoized per string.
+    """
+    return event_type.partition(".")[0] in KNOWN_PREFIXES
@@ -9,6 +9,7 @@ Source: ADR-0008 (Stage 2), ADR-0013 (Consumer 3)
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import orjson
@@ -79,8 +80,7 @@ class EnrichmentConsumer(BaseConsumer):
             )
             return
 
-        raw_str = raw_json.decode() if isinstance(raw_json, bytes) else raw_json
-        parsed = orjson.loads(raw_str)
+        parsed = orjson.loads(raw_json)
         doc = parsed[0] if isinstance(parsed, list) and len(parsed) > 0 else parsed
 
         # Extract keywords from event_type
@@ -144,13 +144,23 @@ def build_event_text(event_type: str, tool_name: str | None, keywords: list[str]
     return " ".join(parts)
 
 
+@lru_cache(maxsize=256)
+def _split_event_type(event_type: str) -> tuple[str, ...]:
+    """Split a dot-namespaced event_type into its non-empty parts.
+
+    Event types come from a small closed vocabulary, so each one is split
+    once per process.
+    """
+    return tuple(part for part in event_type.split(".") if part)
+
+
 def extract_keywords(event_type: str, tool_name: str | None = None) -> list[str]:
     """Extract keywords from an event_type string and optional tool_name.
 
     Splits event_type by '.' to get component parts, and adds tool_name
     if present and not already included.
     """
-    keywords = [part for part in event_type.split(".") if part]
+    keywords = list(_split_event_type(event_type))
     if tool_name and tool_name not in keywords:
         keywords.append(tool_name)
     return keywords
@@ -10,6 +10,7 @@ Source: ADR-0013 Consumer 2
 
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -23,6 +24,8 @@ from context_graph.domain.contradiction import (
 from context_graph.domain.entity_resolution import (
     EntityResolutionAction,
     SemanticCandidate,
+    add_to_entity_index,
+    build_entity_index,
     compute_transitive_closure,
     resolve_close_match,
     resolve_exact_match,
@@ -75,7 +78,7 @@ class ExtractionConsumer(BaseConsumer):
         self._llm_client = llm_client
         self._settings = settings
         self._event_key_prefix = settings.redis.event_key_prefix
-        self._session_turn_counts: dict[str, int] = {}
+        self._session_turn_counts: defaultdict[str, int] = defaultdict(int)
         self._mid_session_interval: int = getattr(settings, "mid_session_extraction_interval", 50)
         self._embedding_service = embedding_service
         self._graph_store = graph_store
@@ -87,8 +90,7 @@ class ExtractionConsumer(BaseConsumer):
         raw_json = await self._redis.execute_command("JSON.GET", json_key, "$")  # type: ignore[no-untyped-call]
         if raw_json is None:
             return None
-        raw_str = raw_json.decode() if isinstance(raw_json, bytes) else raw_json
-        parsed = orjson.loads(raw_str)
+        parsed = orjson.loads(raw_json)
         doc: dict[str, Any] = parsed[0] if isinstance(parsed, list) and len(parsed) > 0 else parsed
         return doc
 
@@ -113,12 +115,13 @@ class ExtractionConsumer(BaseConsumer):
 
         # Track per-session turn counts for mid-session extraction
         if event_type and not event_type.startswith("system.") and session_id:
-            self._session_turn_counts[session_id] = self._session_turn_counts.get(session_id, 0) + 1
-            if self._session_turn_counts[session_id] % self._mid_session_interval == 0:
+            self._session_turn_counts[session_id] += 1
+            turn_count = self._session_turn_counts[session_id]
+            if turn_count % self._mid_session_interval == 0:
                 log.info(
                     "mid_session_extraction_triggered",
                     session_id=session_id,
-                    turn_count=self._session_turn_counts[session_id],
+                    turn_count=turn_count,
                 )
                 events, raw_docs = await self._collect_session_events(session_id)
                 if events:
@@ -207,24 +210,21 @@ class ExtractionConsumer(BaseConsumer):
             return events, raw_docs
 
         for _entry_id, entry_data in session_entries:
-            decoded = {
-                (k.decode() if isinstance(k, bytes) else k): (
-                    v.decode() if isinstance(v, bytes) else v
-                )
-                for k, v in entry_data.items()
-            }
-
-            event_id = decoded.get("event_id")
-            if not event_id:
+            # Only event_id is needed; look it up directly instead of
+            # decoding every field of the entry.
+            raw_event_id = entry_data.get(b"event_id")
+            if raw_event_id is None:
+                raw_event_id = entry_data.get("event_id")
+            if not raw_event_id:
                 continue
+            event_id = raw_event_id.decode() if isinstance(raw_event_id, bytes) else raw_event_id
 
             json_key = f"{self._event_key_prefix}{event_id}"
             raw_json = await self._redis.execute_command("JSON.GET", json_key, "$")  # type: ignore[no-untyped-call]
             if raw_json is None:
                 continue
 
-            raw_str = raw_json.decode() if isinstance(raw_json, bytes) else raw_json
-            parsed = orjson.loads(raw_str)
+            parsed = orjson.loads(raw_json)
             doc = parsed[0] if isinstance(parsed, list) and len(parsed) > 0 else parsed
 
             # Keep full doc for payload extraction before stripping
@@ -297,6 +297,7 @@ class ExtractionConsumer(BaseConsumer):
 
         # --- Write extracted entities + REFERENCES edges ---
         existing_entities = await self._fetch_existing_entities()
+        entity_index = build_entity_index(existing_entities)
         same_as_edges: list[tuple[str, str]] = []
         mention_counts: dict[str, int] = {
             e["entity_id"]: 1 for e in existing_entities if "entity_id" in e
@@ -309,7 +310,7 @@ class ExtractionConsumer(BaseConsumer):
                 continue
 
             # Run entity resolution cascade: Tier 1 -> 2a -> 2b
-            resolution = resolve_exact_match(entity_name, entity_type, existing_entities)
+            resolution = resolve_exact_match(entity_name, entity_type, entity_index)
             if resolution is None:
                 resolution = resolve_close_match(
                     entity_name, entity_type, existing_entities, threshold=0.9
@@ -368,9 +369,13 @@ class ExtractionConsumer(BaseConsumer):
                     now=now,
                     embedding=embedding,
                 )
-                existing_entities.append(
-                    {"entity_id": entity_id, "name": entity_name, "entity_type": entity_type}
-                )
+                new_entity = {
+                    "entity_id": entity_id,
+                    "name": entity_name,
+                    "entity_type": entity_type,
+                }
+                existing_entities.append(new_entity)
+                add_to_entity_index(entity_index, new_entity)
                 mention_counts[entity_id] = mention_counts.get(entity_id, 0) + 1
                 log.debug("entity_created", name=entity_name, entity_id=entity_id)
 
@@ -169,8 +169,7 @@ class ProjectionConsumer(BaseConsumer):
             )
             return None
 
-        raw_str = raw_json.decode() if isinstance(raw_json, bytes) else raw_json
-        parsed = orjson.loads(raw_str)
+        parsed = orjson.loads(raw_json)
         doc = parsed[0] if isinstance(parsed, list) and len(parsed) > 0 else parsed
         doc.pop("occurred_at_epoch_ms", None)
         event = Event.model_validate(doc, strict=False)
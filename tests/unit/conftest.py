@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 import pytest
 
 if TYPE_CHECKING:
+    from fastapi import APIRouter
     from fastapi.testclient import TestClient
 
     from context_graph.domain.models import (
@@ -242,38 +243,57 @@ def stub_graph_store() -> StubGraphStore:
     return StubGraphStore(healthy=True)
 
 
-@pytest.fixture()
-def test_client(
-    in_memory_event_store: InMemoryEventStore,
-    stub_graph_store: StubGraphStore,
+def make_api_client(
+    routers: list[APIRouter],
+    *,
+    event_store: object | None = None,
+    graph_store: object | None = None,
 ) -> TestClient:
-    """FastAPI TestClient with in-memory stores (no Redis/Neo4j needed)."""
+    """Build a TestClient for the given routers, wired with the supplied stores."""
     from fastapi import FastAPI
     from fastapi.responses import ORJSONResponse
     from fastapi.testclient import TestClient as _TestClient
 
     from context_graph.api.middleware import register_middleware
-    from context_graph.api.routes.context import router as context_router
-    from context_graph.api.routes.entities import router as entities_router
-    from context_graph.api.routes.events import router as events_router
-    from context_graph.api.routes.health import router as health_router
-    from context_graph.api.routes.lineage import router as lineage_router
-    from context_graph.api.routes.query import router as query_router
+    from context_graph.settings import Settings
 
     app = FastAPI(default_response_class=ORJSONResponse)
     register_middleware(app)
-    app.include_router(events_router, prefix="/v1")
-    app.include_router(health_router, prefix="/v1")
-    app.include_router(context_router, prefix="/v1")
-    app.include_router(query_router, prefix="/v1")
-    app.include_router(lineage_router, prefix="/v1")
-    app.include_router(entities_router, prefix="/v1")
+    for router in routers:
+        app.include_router(router, prefix="/v1")
 
-    from context_graph.settings import Settings
-
-    # Wire stubs into app state (settings needed for auth dependency)
+    # Settings are needed for the auth dependency
     app.state.settings = Settings()
-    app.state.event_store = in_memory_event_store
-    app.state.graph_store = stub_graph_store
+    if event_store is not None:
+        app.state.event_store = event_store
+    if graph_store is not None:
+        app.state.graph_store = graph_store
 
     return _TestClient(app)
+
+
+@pytest.fixture()
+def test_client(
+    in_memory_event_store: InMemoryEventStore,
+    stub_graph_store: StubGraphStore,
+) -> TestClient:
+    """FastAPI TestClient with in-memory stores (no Redis/Neo4j needed)."""
+    from context_graph.api.routes.context import router as context_router
+    from context_graph.api.routes.entities import router as entities_router
+    from context_graph.api.routes.events import router as events_router
+    from context_graph.api.routes.health import router as health_router
+    from context_graph.api.routes.lineage import router as lineage_router
+    from context_graph.api.routes.query import router as query_router
+
+    return make_api_client(
+        [
+            events_router,
+            health_router,
+            context_router,
+            query_router,
+            lineage_router,
+            entities_router,
+        ],
+        event_store=in_memory_event_store,
+        graph_store=stub_graph_store,
+    )
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from tests.unit.conftest import InMemoryEventStore, StubGraphStore
+from tests.unit.conftest import InMemoryEventStore, StubGraphStore, make_api_client
 
 if TYPE_CHECKING:
     from fastapi.testclient import TestClient
@@ -69,29 +69,18 @@ def _make_admin_client(
     stream_length: int = 42,
 ) -> TestClient:
     """Build a FastAPI TestClient with admin-compatible protocol stubs."""
-    from fastapi import FastAPI
-    from fastapi.responses import ORJSONResponse
-    from fastapi.testclient import TestClient as _TestClient
-
-    from context_graph.api.middleware import register_middleware
     from context_graph.api.routes.admin import router as admin_router
     from context_graph.api.routes.health import router as health_router
-    from context_graph.settings import Settings
-
-    app = FastAPI(default_response_class=ORJSONResponse)
-    register_middleware(app)
-    app.include_router(health_router, prefix="/v1")
-    app.include_router(admin_router, prefix="/v1")
-
-    app.state.settings = Settings()
-    app.state.event_store = _AdminEventStore(stream_length=stream_length)
-    app.state.graph_store = _AdminGraphStore(
-        session_event_counts=session_event_counts,
-        graph_stats=graph_stats,
-        session_query_results=session_query_results,
-    )
 
-    return _TestClient(app)
+    return make_api_client(
+        [health_router, admin_router],
+        event_store=_AdminEventStore(stream_length=stream_length),
+        graph_store=_AdminGraphStore(
+            session_event_counts=session_event_counts,
+            graph_stats=graph_stats,
+            session_query_results=session_query_results,
+        ),
+    )
 
 
 @pytest.fixture()
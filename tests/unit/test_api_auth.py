@@ -11,6 +11,8 @@ from unittest.mock import patch
 
 import pytest
 
+from context_graph.api import dependencies as _dependencies
+
 if TYPE_CHECKING:
     from fastapi.testclient import TestClient
 
@@ -123,7 +125,7 @@ class TestTimingSafeComparison:
     """Verify that auth uses hmac.compare_digest for timing-safe comparison."""
 
     def test_api_key_uses_hmac_compare_digest(self, auth_test_client: TestClient) -> None:
-        with patch("context_graph.api.dependencies.hmac") as mock_hmac:
+        with patch.object(_dependencies, "hmac") as mock_hmac:
             mock_hmac.compare_digest.return_value = False
             resp = auth_test_client.post(
                 "/v1/events",
@@ -134,7 +136,7 @@ class TestTimingSafeComparison:
             mock_hmac.compare_digest.assert_called_once_with("wrong-key", "test-api-key")
 
     def test_admin_key_uses_hmac_compare_digest(self, auth_test_client: TestClient) -> None:
-        with patch("context_graph.api.dependencies.hmac") as mock_hmac:
+        with patch.object(_dependencies, "hmac") as mock_hmac:
             mock_hmac.compare_digest.return_value = False
             resp = auth_test_client.get(
                 "/v1/users/u1/profile",
@@ -148,7 +150,7 @@ class TestAuthFailureLogging:
     """Verify that failed auth attempts are logged."""
 
     def test_failed_api_key_logs_warning(self, auth_test_client: TestClient) -> None:
-        with patch("context_graph.api.dependencies.logger") as mock_logger:
+        with patch.object(_dependencies, "logger") as mock_logger:
             auth_test_client.post(
                 "/v1/events",
                 json={"event_type": "test"},
@@ -159,7 +161,7 @@ class TestAuthFailureLogging:
             )
 
     def test_failed_admin_key_logs_warning(self, auth_test_client: TestClient) -> None:
-        with patch("context_graph.api.dependencies.logger") as mock_logger:
+        with patch.object(_dependencies, "logger") as mock_logger:
             auth_test_client.get(
                 "/v1/users/u1/profile",
                 headers={"Authorization": "Bearer bad-key"},
@@ -169,7 +171,7 @@ class TestAuthFailureLogging:
             )
 
     def test_missing_token_logs_warning(self, auth_test_client: TestClient) -> None:
-        with patch("context_graph.api.dependencies.logger") as mock_logger:
+        with patch.object(_dependencies, "logger") as mock_logger:
             auth_test_client.post("/v1/events", json={"event_type": "test"})
             mock_logger.warning.assert_called_once_with(
                 "auth_failed", path="/v1/events", guard="api_key"
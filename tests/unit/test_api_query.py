@@ -7,11 +7,37 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import httpx
+import orjson
+import pytest
+
 if TYPE_CHECKING:
     from fastapi.testclient import TestClient
 
     from tests.unit.conftest import StubGraphStore
 
+# Pre-parsed request URLs: httpx accepts URL objects directly and skips
+# re-parsing the string on every request.
+_URL_CTX = httpx.URL("/v1/context/test-session")
+_URL_CTX_QUERY_WHY = httpx.URL("/v1/context/test-session?query=why")
+_URL_CTX_MAX_NODES_50 = httpx.URL("/v1/context/test-session?max_nodes=50")
+_URL_CTX_MAX_NODES_999 = httpx.URL("/v1/context/test-session?max_nodes=999")
+_URL_CTX_MAX_NODES_0 = httpx.URL("/v1/context/test-session?max_nodes=0")
+_URL_CTX_MAX_DEPTH_5 = httpx.URL("/v1/context/test-session?max_depth=5")
+_URL_CTX_MAX_DEPTH_20 = httpx.URL("/v1/context/test-session?max_depth=20")
+_URL_LINEAGE = httpx.URL("/v1/nodes/test-id/lineage")
+_URL_LINEAGE_PARAMS = httpx.URL("/v1/nodes/test-id/lineage?max_depth=5&max_nodes=50")
+_URL_LINEAGE_INTENT_WHY = httpx.URL("/v1/nodes/test-id/lineage?intent=why")
+_URL_LINEAGE_MAX_DEPTH_100 = httpx.URL("/v1/nodes/test-id/lineage?max_depth=100")
+_URL_LINEAGE_MAX_NODES_999 = httpx.URL("/v1/nodes/test-id/lineage?max_nodes=999")
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _post_json(client: TestClient, path: str, obj: dict[str, object]) -> httpx.Response:
+    """POST an orjson-encoded body, matching the app's ORJSONResponse serializer."""
+    return client.post(path, content=orjson.dumps(obj), headers=_JSON_HEADERS)
+
 
 # ---------------------------------------------------------------------------
 # GET /v1/context/{session_id}
@@ -22,7 +48,7 @@ class TestGetContext:
     """Tests for the session context endpoint."""
 
     def test_get_context(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/context/test-session")
+        response = test_client.get(_URL_CTX)
 
         assert response.status_code == 200
         body = response.json()
@@ -32,31 +58,27 @@ class TestGetContext:
         assert "pagination" in body
 
     def test_get_context_with_query(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/context/test-session?query=why")
+        response = test_client.get(_URL_CTX_QUERY_WHY)
 
         assert response.status_code == 200
         body = response.json()
         assert "nodes" in body
 
     def test_get_context_with_max_nodes(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/context/test-session?max_nodes=50")
+        response = test_client.get(_URL_CTX_MAX_NODES_50)
 
         assert response.status_code == 200
 
     def test_get_context_max_nodes_too_large(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/context/test-session?max_nodes=999")
+        response = test_client.get(_URL_CTX_MAX_NODES_999)
 
         assert response.status_code == 422
 
     def test_get_context_max_nodes_too_small(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/context/test-session?max_nodes=0")
+        response = test_client.get(_URL_CTX_MAX_NODES_0)
 
         assert response.status_code == 422
 
-    def test_get_context_has_timing_header(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/context/test-session")
-        assert "x-request-time-ms" in response.headers
-
 
 # ---------------------------------------------------------------------------
 # POST /v1/query/subgraph
@@ -72,7 +94,7 @@ class TestQuerySubgraph:
             "session_id": "test-session",
             "agent_id": "test-agent",
         }
-        response = test_client.post("/v1/query/subgraph", json=payload)
+        response = _post_json(test_client, "/v1/query/subgraph", payload)
 
         assert response.status_code == 200
         body = response.json()
@@ -89,12 +111,12 @@ class TestQuerySubgraph:
             "max_depth": 5,
             "intent": "when",
         }
-        response = test_client.post("/v1/query/subgraph", json=payload)
+        response = _post_json(test_client, "/v1/query/subgraph", payload)
 
         assert response.status_code == 200
 
     def test_query_subgraph_missing_fields(self, test_client: TestClient) -> None:
-        response = test_client.post("/v1/query/subgraph", json={})
+        response = _post_json(test_client, "/v1/query/subgraph", {})
 
         assert response.status_code == 422
 
@@ -104,19 +126,10 @@ class TestQuerySubgraph:
             "session_id": "test-session",
             "agent_id": "test-agent",
         }
-        response = test_client.post("/v1/query/subgraph", json=payload)
+        response = _post_json(test_client, "/v1/query/subgraph", payload)
 
         assert response.status_code == 422
 
-    def test_query_subgraph_has_timing_header(self, test_client: TestClient) -> None:
-        payload = {
-            "query": "what happened?",
-            "session_id": "test-session",
-            "agent_id": "test-agent",
-        }
-        response = test_client.post("/v1/query/subgraph", json=payload)
-        assert "x-request-time-ms" in response.headers
-
 
 # ---------------------------------------------------------------------------
 # GET /v1/nodes/{node_id}/lineage
@@ -127,7 +140,7 @@ class TestGetLineage:
     """Tests for the lineage traversal endpoint."""
 
     def test_get_lineage(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/nodes/test-id/lineage")
+        response = test_client.get(_URL_LINEAGE)
 
         assert response.status_code == 200
         body = response.json()
@@ -136,29 +149,25 @@ class TestGetLineage:
         assert "meta" in body
 
     def test_get_lineage_with_params(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/nodes/test-id/lineage?max_depth=5&max_nodes=50")
+        response = test_client.get(_URL_LINEAGE_PARAMS)
 
         assert response.status_code == 200
 
     def test_get_lineage_with_intent(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/nodes/test-id/lineage?intent=why")
+        response = test_client.get(_URL_LINEAGE_INTENT_WHY)
 
         assert response.status_code == 200
 
     def test_get_lineage_max_depth_too_large(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/nodes/test-id/lineage?max_depth=100")
+        response = test_client.get(_URL_LINEAGE_MAX_DEPTH_100)
 
         assert response.status_code == 422
 
     def test_get_lineage_max_nodes_too_large(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/nodes/test-id/lineage?max_nodes=999")
+        response = test_client.get(_URL_LINEAGE_MAX_NODES_999)
 
         assert response.status_code == 422
 
-    def test_get_lineage_has_timing_header(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/nodes/test-id/lineage")
-        assert "x-request-time-ms" in response.headers
-
 
 # ---------------------------------------------------------------------------
 # GET /v1/entities/{entity_id}
@@ -191,8 +200,43 @@ class TestGetEntity:
         assert body["entity_id"] == "test-entity"
         assert body["name"] == "Test Entity"
 
-    def test_get_entity_has_timing_header(self, test_client: TestClient) -> None:
-        response = test_client.get("/v1/entities/some-entity")
+
+# ---------------------------------------------------------------------------
+# Timing header (all query endpoints)
+# ---------------------------------------------------------------------------
+
+# (method, url, body) — dispatched through a single ``TestClient.request`` path.
+_TIMED_REQUESTS: list[tuple[str, httpx.URL, bytes | None]] = [
+    ("GET", _URL_CTX, None),
+    (
+        "POST",
+        httpx.URL("/v1/query/subgraph"),
+        orjson.dumps(
+            {
+                "query": "what happened?",
+                "session_id": "test-session",
+                "agent_id": "test-agent",
+            }
+        ),
+    ),
+    ("GET", _URL_LINEAGE, None),
+    ("GET", httpx.URL("/v1/entities/some-entity"), None),
+]
+
+
+class TestTimingHeader:
+    """Tests for the x-request-time-ms header on every query endpoint."""
+
+    @pytest.mark.parametrize(
+        ("method", "url", "body"),
+        _TIMED_REQUESTS,
+        ids=["context", "subgraph", "lineage", "entity"],
+    )
+    def test_has_timing_header(
+        self, test_client: TestClient, method: str, url: httpx.URL, body: bytes | None
+    ) -> None:
+        headers = _JSON_HEADERS if body is not None else None
+        response = test_client.request(method, url, content=body, headers=headers)
         assert "x-request-time-ms" in response.headers
 
 
@@ -204,12 +248,12 @@ class TestGetEntity:
 class TestContextEndpointMaxDepth:
     def test_context_endpoint_accepts_max_depth(self, test_client: TestClient) -> None:
         """max_depth parameter should be accepted."""
-        response = test_client.get("/v1/context/test-session?max_depth=5")
+        response = test_client.get(_URL_CTX_MAX_DEPTH_5)
         assert response.status_code == 200
 
     def test_context_endpoint_rejects_invalid_max_depth(self, test_client: TestClient) -> None:
         """max_depth > 10 should be rejected."""
-        response = test_client.get("/v1/context/test-session?max_depth=20")
+        response = test_client.get(_URL_CTX_MAX_DEPTH_20)
         assert response.status_code == 422
 
 
@@ -221,5 +265,5 @@ class TestContextEndpointMaxDepth:
 class TestLineageDefaultIntent:
     def test_lineage_default_intent_is_why(self, test_client: TestClient) -> None:
         """Default intent should be 'why' for lineage queries."""
-        response = test_client.get("/v1/nodes/test-id/lineage")
+        response = test_client.get(_URL_LINEAGE)
         assert response.status_code == 200
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from tests.unit.conftest import StubGraphStore
+from tests.unit.conftest import StubGraphStore, make_api_client
 
 if TYPE_CHECKING:
     from fastapi.testclient import TestClient
@@ -67,22 +67,9 @@ class _UsersGraphStore(StubGraphStore):
 
 def _make_users_client(**kwargs: Any) -> TestClient:
     """Build a TestClient with a configurable _UsersGraphStore."""
-    from fastapi import FastAPI
-    from fastapi.responses import ORJSONResponse
-    from fastapi.testclient import TestClient as _TestClient
-
-    from context_graph.api.middleware import register_middleware
     from context_graph.api.routes.users import router as users_router
-    from context_graph.settings import Settings
-
-    app = FastAPI(default_response_class=ORJSONResponse)
-    register_middleware(app)
-    app.include_router(users_router, prefix="/v1")
-
-    app.state.settings = Settings()
-    app.state.graph_store = _UsersGraphStore(**kwargs)
 
-    return _TestClient(app)
+    return make_api_client([users_router], graph_store=_UsersGraphStore(**kwargs))
 
 
 # ---------------------------------------------------------------------------
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -16,28 +17,39 @@ from context_graph.domain.consolidation import (
 from context_graph.domain.models import RetentionTier
 from context_graph.settings import RetentionSettings
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+pytestmark = pytest.mark.cpu_only
+
+_BASE = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+# Minute-spaced ISO timestamps from _BASE, indexed by minute offset.
+_ISO = tuple((_BASE + timedelta(minutes=i)).isoformat() for i in range(512))
+
 # ---------------------------------------------------------------------------
 # should_reconsolidate
 # ---------------------------------------------------------------------------
 
 
 class TestShouldReconsolidate:
-    def test_below_threshold(self):
-        assert should_reconsolidate(100.0, threshold=150.0) is False
-
-    def test_at_threshold(self):
-        assert should_reconsolidate(150.0, threshold=150.0) is True
-
-    def test_above_threshold(self):
-        assert should_reconsolidate(200.0, threshold=150.0) is True
-
-    def test_zero_importance(self):
+    @pytest.mark.parametrize(
+        ("importance_sum", "threshold", "expected"),
+        [
+            (100.0, 150.0, False),
+            (150.0, 150.0, True),
+            (200.0, 150.0, True),
+            (200.5, 150.0, True),
+            (149.9, 150.0, False),
+            (50.0, 50.0, True),
+            (49.0, 50.0, False),
+        ],
+    )
+    def test_threshold(self, importance_sum: float, threshold: float, expected: bool):
+        assert should_reconsolidate(importance_sum, threshold=threshold) is expected
+
+    def test_zero_importance_default_threshold(self):
         assert should_reconsolidate(0.0) is False
 
-    def test_custom_threshold(self):
-        assert should_reconsolidate(50.0, threshold=50.0) is True
-        assert should_reconsolidate(49.0, threshold=50.0) is False
-
 
 # ---------------------------------------------------------------------------
 # group_events_into_episodes
@@ -46,10 +58,9 @@ class TestShouldReconsolidate:
 
 class TestGroupEventsIntoEpisodes:
     def _make_event(self, minutes_offset: int, event_id: str = "") -> dict:
-        base = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
         return {
             "event_id": event_id or f"evt-{minutes_offset}",
-            "occurred_at": (base + timedelta(minutes=minutes_offset)).isoformat(),
+            "occurred_at": _ISO[minutes_offset],
             "event_type": "tool.execute",
         }
 
@@ -96,12 +107,11 @@ class TestGroupEventsIntoEpisodes:
         assert len(episodes) == 1  # 0, 30, 60 — all within 35-min gap
 
     def test_datetime_objects(self):
-        base = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
         events = [
-            {"event_id": "a", "occurred_at": base, "event_type": "tool.execute"},
+            {"event_id": "a", "occurred_at": _BASE, "event_type": "tool.execute"},
             {
                 "event_id": "b",
-                "occurred_at": base + timedelta(hours=2),
+                "occurred_at": _BASE + timedelta(hours=2),
                 "event_type": "tool.execute",
             },
         ]
@@ -119,20 +129,29 @@ class TestGroupEventsIntoEpisodes:
 # ---------------------------------------------------------------------------
 
 
-class TestCreateSummaryFromEvents:
-    def _make_events(self, n: int) -> list[dict]:
-        base = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
-        return [
-            {
-                "event_id": f"evt-{i}",
-                "occurred_at": (base + timedelta(minutes=i)).isoformat(),
-                "event_type": "tool.execute" if i % 2 == 0 else "agent.invoke",
-            }
-            for i in range(n)
-        ]
+@pytest.fixture(scope="module")
+def events_factory() -> Callable[[int], list[dict]]:
+    """Return a builder of ``n`` minute-spaced events, memoized per ``n``."""
+    cache: dict[int, list[dict]] = {}
+
+    def make(n: int) -> list[dict]:
+        if n not in cache:
+            cache[n] = [
+                {
+                    "event_id": f"evt-{i}",
+                    "occurred_at": _ISO[i],
+                    "event_type": "tool.execute" if i % 2 == 0 else "agent.invoke",
+                }
+                for i in range(n)
+            ]
+        return cache[n]
 
-    def test_basic_summary(self):
-        events = self._make_events(5)
+    return make
+
+
+class TestCreateSummaryFromEvents:
+    def test_basic_summary(self, events_factory):
+        events = events_factory(5)
         summary = create_summary_from_events(events, scope="episode", scope_id="s1-ep0")
         assert summary.scope == "episode"
         assert summary.scope_id == "s1-ep0"
@@ -145,20 +164,34 @@ class TestCreateSummaryFromEvents:
         with pytest.raises(ValueError, match="empty"):
             create_summary_from_events([], scope="episode", scope_id="s1")
 
-    def test_single_event(self):
-        events = self._make_events(1)
+    def test_single_event(self, events_factory):
+        events = events_factory(1)
         summary = create_summary_from_events(events, scope="session", scope_id="s1")
         assert summary.event_count == 1
         assert summary.time_range[0] == summary.time_range[1]
 
-    def test_deterministic_id(self):
-        events = self._make_events(3)
+    def test_deterministic_id(self, events_factory):
+        events = events_factory(3)
         s1 = create_summary_from_events(events, scope="ep", scope_id="x")
         s2 = create_summary_from_events(events, scope="ep", scope_id="x")
         assert s1.summary_id == s2.summary_id
 
-    def test_different_events_different_id(self):
-        events_a = self._make_events(3)
+    def test_id_ignores_event_order(self, events_factory):
+        events = events_factory(3)
+        s1 = create_summary_from_events(events, scope="ep", scope_id="x")
+        s2 = create_summary_from_events(list(reversed(events)), scope="ep", scope_id="x")
+        assert s1.summary_id == s2.summary_id
+        assert len(s1.summary_id.rsplit("-", 1)[1]) == 12
+
+    def test_id_pinned_for_known_input(self):
+        """summary_id is MERGE key in Neo4j; changing the derivation re-keys summaries."""
+        events = [{"event_id": "evt-b"}, {"event_id": "evt-a"}]
+        summary = create_summary_from_events(events, scope="ep", scope_id="x")
+        # sha256("evt-a|evt-b")[:12]
+        assert summary.summary_id == "summary-x-40ef4dcc0a78"
+
+    def test_different_events_different_id(self, events_factory):
+        events_a = events_factory(3)
         events_b = [
             {
                 "event_id": f"other-{i}",
@@ -171,14 +204,14 @@ class TestCreateSummaryFromEvents:
         s_b = create_summary_from_events(events_b, scope="ep", scope_id="x")
         assert s_a.summary_id != s_b.summary_id
 
-    def test_content_includes_event_types(self):
-        events = self._make_events(4)
+    def test_content_includes_event_types(self, events_factory):
+        events = events_factory(4)
         summary = create_summary_from_events(events, scope="ep", scope_id="x")
         assert "agent.invoke" in summary.content
         assert "tool.execute" in summary.content
 
-    def test_llm_summary_text_used_when_provided(self):
-        events = self._make_events(3)
+    def test_llm_summary_text_used_when_provided(self, events_factory):
+        events = events_factory(3)
         llm_text = "The agent searched for files and processed the results successfully."
         summary = create_summary_from_events(
             events, scope="episode", scope_id="s1-ep0", llm_summary_text=llm_text
@@ -186,15 +219,15 @@ class TestCreateSummaryFromEvents:
         assert summary.content == llm_text
         assert summary.event_count == 3
 
-    def test_fallback_when_llm_summary_is_none(self):
-        events = self._make_events(3)
+    def test_fallback_when_llm_summary_is_none(self, events_factory):
+        events = events_factory(3)
         summary = create_summary_from_events(
             events, scope="episode", scope_id="s1-ep0", llm_summary_text=None
         )
         assert "3 events" in summary.content
 
-    def test_fallback_when_llm_summary_is_empty(self):
-        events = self._make_events(3)
+    def test_fallback_when_llm_summary_is_empty(self, events_factory):
+        events = events_factory(3)
         summary = create_summary_from_events(
             events, scope="episode", scope_id="s1-ep0", llm_summary_text=""
         )
@@ -254,85 +287,102 @@ class TestBuildSummaryPrompt:
         assert "tool.execute" in event_lines[0]
         assert "agent.invoke" in event_lines[1]
 
+    def test_sorted_across_utc_offsets(self):
+        events = [
+            {
+                "event_id": "e2",
+                "occurred_at": "2025-01-01T12:30:00+00:00",
+                "event_type": "agent.invoke",
+            },
+            {
+                "event_id": "e1",
+                "occurred_at": "2025-01-01T13:00:00+02:00",  # 11:00 UTC
+                "event_type": "tool.execute",
+            },
+        ]
+        event_lines = [
+            line for line in build_summary_prompt(events).split("\n") if line.startswith("- ")
+        ]
+        assert "tool.execute" in event_lines[0]
+        assert "agent.invoke" in event_lines[1]
+
+    def test_missing_occurred_at_sorts_first(self):
+        events = [
+            {
+                "event_id": "e2",
+                "occurred_at": "2025-01-01T12:00:00+00:00",
+                "event_type": "llm.chat",
+            },
+            {"event_id": "e1", "event_type": "agent.invoke"},
+        ]
+        event_lines = [
+            line for line in build_summary_prompt(events).split("\n") if line.startswith("- ")
+        ]
+        assert "agent.invoke" in event_lines[0]
+
 
 # ---------------------------------------------------------------------------
 # select_events_for_pruning
 # ---------------------------------------------------------------------------
 
 
-class TestSelectEventsForPruning:
-    def _make_retention(self) -> RetentionSettings:
-        return RetentionSettings(
-            hot_hours=24,
-            warm_hours=168,
-            cold_hours=720,
-            warm_min_similarity_score=0.7,
-            cold_min_importance=5,
-            cold_min_access_count=3,
-        )
+@pytest.fixture(scope="session")
+def retention() -> RetentionSettings:
+    """One validated RetentionSettings shared by every pruning test (never mutated)."""
+    return RetentionSettings(
+        hot_hours=24,
+        warm_hours=168,
+        cold_hours=720,
+        warm_min_similarity_score=0.7,
+        cold_min_importance=5,
+        cold_min_access_count=3,
+    )
+
 
-    def test_hot_tier_no_pruning(self):
+class TestSelectEventsForPruning:
+    def test_hot_tier_no_pruning(self, retention):
         events = [
             {"event_id": "e1", "importance_score": 1, "access_count": 0},
         ]
-        result = select_events_for_pruning(events, RetentionTier.HOT, self._make_retention())
+        result = select_events_for_pruning(events, RetentionTier.HOT, retention)
         assert result == []
 
-    def test_warm_tier_low_importance_no_access(self):
+    def test_warm_tier_low_importance_no_access(self, retention):
         events = [
             {"event_id": "e1", "importance_score": 2, "access_count": 0},
             {"event_id": "e2", "importance_score": 7, "access_count": 0},
         ]
-        result = select_events_for_pruning(events, RetentionTier.WARM, self._make_retention())
+        result = select_events_for_pruning(events, RetentionTier.WARM, retention)
         assert "e1" in result
         assert "e2" not in result
 
-    def test_cold_tier_pruning(self):
+    def test_cold_tier_pruning(self, retention):
         events = [
             {"event_id": "e1", "importance_score": 3, "access_count": 1},
             {"event_id": "e2", "importance_score": 8, "access_count": 5},
             {"event_id": "e3", "importance_score": 4, "access_count": 4},
         ]
-        result = select_events_for_pruning(events, RetentionTier.COLD, self._make_retention())
+        result = select_events_for_pruning(events, RetentionTier.COLD, retention)
         assert "e1" in result  # low importance AND low access
         assert "e2" not in result  # high importance AND high access
         assert "e3" not in result  # low importance but access >= 3 saves it
 
-    def test_archive_tier_all_pruned(self):
+    def test_archive_tier_all_pruned(self, retention):
         events = [
             {"event_id": "e1", "importance_score": 10, "access_count": 100},
             {"event_id": "e2", "importance_score": 1, "access_count": 0},
         ]
-        result = select_events_for_pruning(events, RetentionTier.ARCHIVE, self._make_retention())
+        result = select_events_for_pruning(events, RetentionTier.ARCHIVE, retention)
         assert len(result) == 2
 
-    def test_missing_event_id_skipped(self):
+    def test_missing_event_id_skipped(self, retention):
         events = [{"importance_score": 1, "access_count": 0}]
-        result = select_events_for_pruning(events, RetentionTier.COLD, self._make_retention())
+        result = select_events_for_pruning(events, RetentionTier.COLD, retention)
         assert result == []
 
-    def test_none_importance_treated_as_zero(self):
+    def test_none_importance_treated_as_zero(self, retention):
         events = [
             {"event_id": "e1", "importance_score": None, "access_count": 0},
         ]
-        result = select_events_for_pruning(events, RetentionTier.COLD, self._make_retention())
+        result = select_events_for_pruning(events, RetentionTier.COLD, retention)
         assert "e1" in result
-
-
-# ---------------------------------------------------------------------------
-# should_reconsolidate with importance sum (regression tests)
-# ---------------------------------------------------------------------------
-
-
-class TestShouldReconsolidateImportanceSum:
-    def test_importance_sum_below_threshold(self):
-        assert should_reconsolidate(100.0, threshold=150.0) is False
-
-    def test_importance_sum_at_threshold(self):
-        assert should_reconsolidate(150.0, threshold=150.0) is True
-
-    def test_importance_sum_above_threshold(self):
-        assert should_reconsolidate(200.5, threshold=150.0) is True
-
-    def test_float_threshold(self):
-        assert should_reconsolidate(149.9, threshold=150.0) is False
@@ -9,6 +9,8 @@ import pytest
 
 from context_graph.worker.enrichment import build_event_text, extract_keywords
 
+pytestmark = pytest.mark.cpu_only
+
 
 class TestExtractKeywords:
     def test_keyword_extraction_from_event_type(self) -> None:
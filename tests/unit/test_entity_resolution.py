@@ -6,17 +6,24 @@ resolution result structures.
 
 from __future__ import annotations
 
+import pytest
+
 from context_graph.domain.entity_resolution import (
     DOMAIN_ALIAS_DICT,
     EntityResolutionAction,
     EntityResolutionResult,
+    add_to_entity_index,
+    build_entity_index,
     compute_name_similarity,
     normalize_entity_name,
     resolve_alias,
     resolve_close_match,
+    resolve_close_match_batch,
     resolve_exact_match,
 )
 
+pytestmark = pytest.mark.cpu_only
+
 # ---------------------------------------------------------------------------
 # normalize_entity_name
 # ---------------------------------------------------------------------------
@@ -69,6 +76,12 @@ class TestResolveAlias:
     def test_canonical_name_returns_itself_normalized(self):
         assert resolve_alias("Python") == "python"
 
+    def test_normalized_alias_maps_to_canonical(self):
+        assert resolve_alias("qb") == "quickbooks"
+
+    def test_normalized_canonical_returns_itself(self):
+        assert resolve_alias("python") == "python"
+
 
 # ---------------------------------------------------------------------------
 # DOMAIN_ALIAS_DICT
@@ -117,45 +130,116 @@ class TestEntityResolutionResult:
         assert result.canonical_name == "quickbooks"
         assert result.confidence == 1.0
 
+    def test_results_are_hashable(self):
+        kwargs = {
+            "action": EntityResolutionAction.SAME_AS,
+            "canonical_name": "quickbooks",
+            "entity_type": "tool",
+            "confidence": 0.95,
+            "justification": "Fuzzy match",
+        }
+        results = {EntityResolutionResult(**kwargs), EntityResolutionResult(**kwargs)}
+        assert len(results) == 1
+
 
 # ---------------------------------------------------------------------------
 # resolve_exact_match
 # ---------------------------------------------------------------------------
 
 
-class TestResolveExactMatch:
-    def _entities(self) -> list[dict]:
-        return [
-            {"name": "QuickBooks", "entity_type": "tool"},
-            {"name": "Stripe", "entity_type": "service"},
-            {"name": "Python", "entity_type": "concept"},
-        ]
+@pytest.fixture(scope="class")
+def exact_match_entities() -> list[dict]:
+    return [
+        {"name": "QuickBooks", "entity_type": "tool"},
+        {"name": "Stripe", "entity_type": "service"},
+        {"name": "Python", "entity_type": "concept"},
+    ]
+
 
-    def test_exact_match_same_type(self):
-        result = resolve_exact_match("quickbooks", "tool", self._entities())
+class TestResolveExactMatch:
+    def test_exact_match_same_type(self, exact_match_entities):
+        result = resolve_exact_match("quickbooks", "tool", exact_match_entities)
         assert result is not None
         assert result.action == EntityResolutionAction.MERGE
         assert result.confidence == 1.0
 
-    def test_exact_match_via_alias(self):
-        result = resolve_exact_match("QB", "tool", self._entities())
+    def test_exact_match_via_alias(self, exact_match_entities):
+        result = resolve_exact_match("QB", "tool", exact_match_entities)
         assert result is not None
         assert result.action == EntityResolutionAction.MERGE
 
-    def test_exact_match_different_type(self):
-        result = resolve_exact_match("Python", "tool", self._entities())
+    def test_exact_match_different_type(self, exact_match_entities):
+        result = resolve_exact_match("Python", "tool", exact_match_entities)
         assert result is not None
         assert result.action == EntityResolutionAction.SAME_AS
         assert result.confidence == 0.9
 
-    def test_no_match(self):
-        result = resolve_exact_match("Terraform", "tool", self._entities())
+    def test_no_match(self, exact_match_entities):
+        result = resolve_exact_match("Terraform", "tool", exact_match_entities)
         assert result is None
 
     def test_empty_entities_list(self):
         result = resolve_exact_match("anything", "tool", [])
         assert result is None
 
+    def test_prebuilt_index_matches_list(self, exact_match_entities):
+        index = build_entity_index(exact_match_entities)
+        for name, entity_type in [("QB", "tool"), ("Python", "tool"), ("Terraform", "tool")]:
+            assert resolve_exact_match(name, entity_type, index) == resolve_exact_match(
+                name, entity_type, exact_match_entities
+            )
+
+    def test_index_returns_first_listed_entity(self):
+        entities = [
+            {"name": "Python", "entity_type": "concept"},
+            {"name": "py", "entity_type": "tool"},
+        ]
+        result = resolve_exact_match("python", "tool", build_entity_index(entities))
+        assert result is not None
+        assert result.action == EntityResolutionAction.SAME_AS
+        assert result.entity_type == "concept"
+
+    def test_added_entity_is_indexed(self):
+        index = build_entity_index([])
+        add_to_entity_index(index, {"name": "Terraform", "entity_type": "tool"})
+        result = resolve_exact_match("terraform", "tool", index)
+        assert result is not None
+        assert result.action == EntityResolutionAction.MERGE
+
+
+# The two "acme" entities tie on score, so the earlier one (type "org") wins.
+_CLOSE_MATCH_POOL = [
+    {"name": "QuickBooks Online", "entity_type": "tool"},
+    {"name": "PayPal", "entity_type": "service"},
+    {"name": "acme", "entity_type": "org"},
+    {"name": "acme", "entity_type": "tool"},
+]
+_CLOSE_MATCH_QUERIES = [
+    ("QuickBooks Onlin", "tool"),
+    ("QuickBooks Onlin", "service"),
+    ("Terraform", "tool"),
+    ("paypal", "service"),
+    ("acme", "tool"),
+]
+# (action, canonical_name, entity_type, confidence); "quickbooks onlin" vs
+# "quickbooks online" scores 32/33.
+_CLOSE_MATCH_EXPECTED = [
+    (EntityResolutionAction.SAME_AS, "quickbooks", "tool", 0.9697),
+    (EntityResolutionAction.RELATED_TO, "quickbooks", "tool", 0.9697),
+    None,
+    (EntityResolutionAction.SAME_AS, "paypal", "service", 1.0),
+    (EntityResolutionAction.RELATED_TO, "acme", "org", 1.0),
+]
+
+
+def _summarize(
+    results: list[EntityResolutionResult | None],
+) -> list[tuple[EntityResolutionAction, str, str, float] | None]:
+    return [
+        None if r is None else (r.action, r.canonical_name, r.entity_type, r.confidence)
+        for r in results
+    ]
+
 
 # ---------------------------------------------------------------------------
 # compute_name_similarity
@@ -181,31 +265,40 @@ class TestComputeNameSimilarity:
         assert compute_name_similarity("", "python") == 0.0
         assert compute_name_similarity("python", "") == 0.0
 
+    def test_scorer_is_indel_ratio(self):
+        # difflib.SequenceMatcher scores this pair 8/11 (0.727); the Indel
+        # ratio used in every install scores it 9/11 (0.818).
+        assert compute_name_similarity("search node", "search open") == pytest.approx(9 / 11)
+
 
 # ---------------------------------------------------------------------------
 # resolve_close_match
 # ---------------------------------------------------------------------------
 
 
-class TestResolveCloseMatch:
-    def _entities(self) -> list[dict]:
-        return [
-            {"name": "QuickBooks Online", "entity_type": "tool"},
-            {"name": "PayPal", "entity_type": "service"},
-        ]
+@pytest.fixture(scope="class")
+def close_match_entities() -> list[dict]:
+    return [
+        {"name": "QuickBooks Online", "entity_type": "tool"},
+        {"name": "PayPal", "entity_type": "service"},
+    ]
 
-    def test_close_match_found(self):
-        result = resolve_close_match("QuickBooks Onlin", "tool", self._entities(), threshold=0.85)
+
+class TestResolveCloseMatch:
+    def test_close_match_found(self, close_match_entities):
+        result = resolve_close_match(
+            "QuickBooks Onlin", "tool", close_match_entities, threshold=0.85
+        )
         assert result is not None
         assert result.action == EntityResolutionAction.SAME_AS
 
-    def test_close_match_not_found(self):
-        result = resolve_close_match("Terraform", "tool", self._entities(), threshold=0.9)
+    def test_close_match_not_found(self, close_match_entities):
+        result = resolve_close_match("Terraform", "tool", close_match_entities, threshold=0.9)
         assert result is None
 
-    def test_close_match_different_type(self):
+    def test_close_match_different_type(self, close_match_entities):
         result = resolve_close_match(
-            "QuickBooks Onlin", "service", self._entities(), threshold=0.85
+            "QuickBooks Onlin", "service", close_match_entities, threshold=0.85
         )
         assert result is not None
         assert result.action == EntityResolutionAction.RELATED_TO
@@ -214,11 +307,24 @@ class TestResolveCloseMatch:
         result = resolve_close_match("anything", "tool", [], threshold=0.9)
         assert result is None
 
-    def test_threshold_respected(self):
+    def test_threshold_respected(self, close_match_entities):
         # Very high threshold should reject moderate matches
-        result = resolve_close_match("QuickBook", "tool", self._entities(), threshold=0.99)
+        result = resolve_close_match("QuickBook", "tool", close_match_entities, threshold=0.99)
         assert result is None
 
+    def test_batch_matches_expected(self):
+        batch = resolve_close_match_batch(_CLOSE_MATCH_QUERIES, _CLOSE_MATCH_POOL, threshold=0.85)
+        assert _summarize(batch) == _CLOSE_MATCH_EXPECTED
+
+    def test_batch_ties_keep_first_entity(self):
+        entities = [
+            {"name": "acme", "entity_type": "org"},
+            {"name": "acme", "entity_type": "tool"},
+        ]
+        (result,) = resolve_close_match_batch([("acme", "tool")], entities, threshold=0.9)
+        assert result is not None
+        assert result.action == EntityResolutionAction.RELATED_TO
+
 
 # ---------------------------------------------------------------------------
 # Regression: close match returns SAME_AS not MERGE (Fix 3, ADR-0011)
@@ -258,3 +364,6 @@ class TestAliasResolutionNewEntries:
 
     def test_alias_csv_hyphenated(self):
         assert resolve_alias("comma-separated values") == "csv"
+
+    def test_alias_lookup_normalizes_whitespace(self):
+        assert resolve_alias("  United   States  Postal Service ") == "usps"
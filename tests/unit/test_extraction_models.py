@@ -6,8 +6,13 @@ source quote validation, and session result aggregation.
 
 from __future__ import annotations
 
+import os
+import re
+from types import MappingProxyType
+from typing import get_args
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from context_graph.domain.extraction import (
     CONFIDENCE_CEILINGS,
@@ -16,10 +21,75 @@ from context_graph.domain.extraction import (
     ExtractedPreference,
     ExtractedSkill,
     SessionExtractionResult,
+    _normalize_text,
     apply_confidence_prior,
+    normalize_conversation,
+    quote_in_conversation,
     validate_source_quote,
 )
 
+# Pure in-process; kept on one xdist worker so pydantic schemas and the
+# module-scoped model fixtures below are built once.
+pytestmark = [pytest.mark.cpu_only, pytest.mark.xdist_group("extraction_models")]
+
+# Known-good constructor kwargs, read-only so tests can only derive variants
+# via ``BASE | {...}``.
+_VALID_ENTITY_KWARGS: MappingProxyType[str, object] = MappingProxyType(
+    {
+        "name": "test",
+        "entity_type": "tool",
+        "confidence": 0.5,
+        "source_quote": "test quote",
+    }
+)
+_VALID_PREFERENCE_KWARGS: MappingProxyType[str, object] = MappingProxyType(
+    {
+        "category": "tool",
+        "key": "test_key",
+        "polarity": "neutral",
+        "strength": 0.5,
+        "confidence": 0.5,
+        "source": "explicit",
+        "source_quote": "test quote",
+    }
+)
+_VALID_SKILL_KWARGS: MappingProxyType[str, object] = MappingProxyType(
+    {
+        "name": "test",
+        "category": "tool_proficiency",
+        "proficiency": 0.5,
+        "confidence": 0.5,
+        "source": "observed",
+        "source_quote": "test quote",
+    }
+)
+_VALID_INTEREST_KWARGS: MappingProxyType[str, object] = MappingProxyType(
+    {
+        "entity_name": "test",
+        "entity_type": "concept",
+        "weight": 0.5,
+        "source": "explicit",
+        "source_quote": "test quote",
+    }
+)
+
+# ---------------------------------------------------------------------------
+# Pydantic runtime
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.skipif(
+    os.environ.get("SLOW_PYDANTIC_OK") == "1",
+    reason="SLOW_PYDANTIC_OK=1 allows a non-compiled pydantic-core locally",
+)
+def test_pydantic_core_is_compiled():
+    """Every model in this module validates through pydantic-core's native extension."""
+    import pydantic_core._pydantic_core as core
+
+    assert core.__file__ is not None
+    assert core.__file__.endswith((".so", ".pyd"))
+
+
 # ---------------------------------------------------------------------------
 # ExtractedEntity
 # ---------------------------------------------------------------------------
@@ -39,60 +109,29 @@ class TestExtractedEntity:
         assert entity.confidence == 0.9
         assert entity.source_turn_index == 3
 
-    def test_entity_all_types(self):
-        for etype in ("agent", "user", "service", "tool", "resource", "concept"):
-            entity = ExtractedEntity(
-                name="test",
-                entity_type=etype,
-                confidence=0.5,
-                source_quote="test quote",
-            )
-            assert entity.entity_type == etype
-
-    def test_entity_invalid_type(self):
-        with pytest.raises(ValidationError):
-            ExtractedEntity(
-                name="test",
-                entity_type="unknown_type",
-                confidence=0.5,
-                source_quote="test quote",
-            )
-
-    def test_entity_confidence_too_high(self):
-        with pytest.raises(ValidationError):
-            ExtractedEntity(
-                name="test",
-                entity_type="tool",
-                confidence=1.5,
-                source_quote="test quote",
-            )
-
-    def test_entity_confidence_too_low(self):
-        with pytest.raises(ValidationError):
-            ExtractedEntity(
-                name="test",
-                entity_type="tool",
-                confidence=-0.1,
-                source_quote="test quote",
-            )
-
-    def test_entity_empty_name_rejected(self):
-        with pytest.raises(ValidationError):
-            ExtractedEntity(
-                name="",
-                entity_type="tool",
-                confidence=0.5,
-                source_quote="test quote",
-            )
-
-    def test_entity_empty_source_quote_rejected(self):
-        with pytest.raises(ValidationError):
-            ExtractedEntity(
-                name="test",
-                entity_type="tool",
-                confidence=0.5,
-                source_quote="",
-            )
+    @pytest.mark.parametrize("etype", ("agent", "user", "service", "tool", "resource", "concept"))
+    def test_entity_all_types(self, etype):
+        assert etype in get_args(ExtractedEntity.model_fields["entity_type"].annotation)
+
+    @pytest.mark.parametrize(
+        "patch",
+        [
+            {"entity_type": "unknown_type"},
+            {"confidence": 1.5},
+            {"confidence": -0.1},
+            {"name": ""},
+            {"source_quote": ""},
+        ],
+        ids=["invalid_type", "confidence_high", "confidence_low", "empty_name", "empty_quote"],
+    )
+    def test_entity_invalid_field_rejected(self, patch):
+        with pytest.raises(ValidationError) as exc_info:
+            ExtractedEntity(**(_VALID_ENTITY_KWARGS | patch))
+        assert [err["loc"] for err in exc_info.value.errors()] == [tuple(patch)]
+
+    def test_entity_non_default_type_validates(self):
+        entity = ExtractedEntity(**(_VALID_ENTITY_KWARGS | {"entity_type": "resource"}))
+        assert entity.entity_type == "resource"
 
     def test_entity_source_turn_index_optional(self):
         entity = ExtractedEntity(
@@ -127,79 +166,45 @@ class TestExtractedPreference:
         assert pref.polarity == "positive"
         assert pref.about_entity == "Slack"
 
-    def test_preference_all_categories(self):
-        for cat in ("tool", "workflow", "communication", "domain", "environment", "style"):
-            pref = ExtractedPreference(
-                category=cat,
-                key="test_key",
-                polarity="neutral",
-                strength=0.5,
-                confidence=0.5,
-                source="explicit",
-                source_quote="test quote",
-            )
-            assert pref.category == cat
-
-    def test_preference_invalid_category(self):
-        with pytest.raises(ValidationError):
-            ExtractedPreference(
-                category="invalid_cat",
-                key="test_key",
-                polarity="neutral",
-                strength=0.5,
-                confidence=0.5,
-                source="explicit",
-                source_quote="test quote",
-            )
-
-    def test_preference_all_polarities(self):
-        for pol in ("positive", "negative", "neutral"):
-            pref = ExtractedPreference(
-                category="tool",
-                key="test_key",
-                polarity=pol,
-                strength=0.5,
-                confidence=0.5,
-                source="explicit",
-                source_quote="test quote",
-            )
-            assert pref.polarity == pol
-
-    def test_preference_all_sources(self):
-        for src in ("explicit", "implicit_intentional", "implicit_unintentional"):
-            pref = ExtractedPreference(
-                category="tool",
-                key="test_key",
-                polarity="neutral",
-                strength=0.5,
-                confidence=0.5,
-                source=src,
-                source_quote="test quote",
-            )
-            assert pref.source == src
-
-    def test_preference_strength_out_of_range(self):
-        with pytest.raises(ValidationError):
-            ExtractedPreference(
-                category="tool",
-                key="test_key",
-                polarity="neutral",
-                strength=1.1,
-                confidence=0.5,
-                source="explicit",
-                source_quote="test quote",
+    @pytest.mark.parametrize(
+        "cat", ("tool", "workflow", "communication", "domain", "environment", "style")
+    )
+    def test_preference_all_categories(self, cat):
+        assert cat in get_args(ExtractedPreference.model_fields["category"].annotation)
+
+    @pytest.mark.parametrize(
+        "patch",
+        [{"category": "invalid_cat"}, {"strength": 1.1}],
+        ids=["invalid_category", "strength_out_of_range"],
+    )
+    def test_preference_invalid_field_rejected(self, patch):
+        with pytest.raises(ValidationError) as exc_info:
+            ExtractedPreference(**(_VALID_PREFERENCE_KWARGS | patch))
+        assert [err["loc"] for err in exc_info.value.errors()] == [tuple(patch)]
+
+    @pytest.mark.parametrize("pol", ("positive", "negative", "neutral"))
+    def test_preference_all_polarities(self, pol):
+        assert pol in get_args(ExtractedPreference.model_fields["polarity"].annotation)
+
+    @pytest.mark.parametrize("src", ("explicit", "implicit_intentional", "implicit_unintentional"))
+    def test_preference_all_sources(self, src):
+        assert src in get_args(ExtractedPreference.model_fields["source"].annotation)
+
+    def test_preference_non_default_literals_validate(self):
+        pref = ExtractedPreference(
+            **(
+                _VALID_PREFERENCE_KWARGS
+                | {"category": "workflow", "polarity": "negative", "source": "implicit_intentional"}
             )
+        )
+        assert (pref.category, pref.polarity, pref.source) == (
+            "workflow",
+            "negative",
+            "implicit_intentional",
+        )
 
     def test_preference_optional_fields_default_none(self):
-        pref = ExtractedPreference(
-            category="tool",
-            key="test_key",
-            polarity="neutral",
-            strength=0.5,
-            confidence=0.5,
-            source="explicit",
-            source_quote="test quote",
-        )
+        pref = ExtractedPreference(**_VALID_PREFERENCE_KWARGS)
         assert pref.context is None
         assert pref.about_entity is None
         assert pref.source_turn_index is None
@@ -224,64 +229,36 @@ class TestExtractedSkill:
         assert skill.name == "Python"
         assert skill.proficiency == 0.8
 
-    def test_skill_all_categories(self):
-        for cat in (
+    @pytest.mark.parametrize(
+        "cat",
+        (
             "programming_language",
             "tool_proficiency",
             "domain_knowledge",
             "workflow_skill",
-        ):
-            skill = ExtractedSkill(
-                name="test",
-                category=cat,
-                proficiency=0.5,
-                confidence=0.5,
-                source="observed",
-                source_quote="test quote",
-            )
-            assert skill.category == cat
-
-    def test_skill_all_sources(self):
-        for src in ("observed", "declared", "inferred"):
-            skill = ExtractedSkill(
-                name="test",
-                category="tool_proficiency",
-                proficiency=0.5,
-                confidence=0.5,
-                source=src,
-                source_quote="test quote",
-            )
-            assert skill.source == src
+        ),
+    )
+    def test_skill_all_categories(self, cat):
+        assert cat in get_args(ExtractedSkill.model_fields["category"].annotation)
+
+    @pytest.mark.parametrize("src", ("observed", "declared", "inferred"))
+    def test_skill_all_sources(self, src):
+        assert src in get_args(ExtractedSkill.model_fields["source"].annotation)
+
+    def test_skill_non_default_literals_validate(self):
+        skill = ExtractedSkill(
+            **(_VALID_SKILL_KWARGS | {"category": "domain_knowledge", "source": "inferred"})
+        )
+        assert (skill.category, skill.source) == ("domain_knowledge", "inferred")
 
     def test_skill_proficiency_bounds(self):
         # Valid boundaries
-        ExtractedSkill(
-            name="test",
-            category="tool_proficiency",
-            proficiency=0.0,
-            confidence=0.0,
-            source="observed",
-            source_quote="test quote",
-        )
-        ExtractedSkill(
-            name="test",
-            category="tool_proficiency",
-            proficiency=1.0,
-            confidence=1.0,
-            source="observed",
-            source_quote="test quote",
-        )
+        ExtractedSkill(**(_VALID_SKILL_KWARGS | {"proficiency": 0.0, "confidence": 0.0}))
+        ExtractedSkill(**(_VALID_SKILL_KWARGS | {"proficiency": 1.0, "confidence": 1.0}))
 
     def test_skill_proficiency_out_of_range(self):
         with pytest.raises(ValidationError):
-            ExtractedSkill(
-                name="test",
-                category="tool_proficiency",
-                proficiency=1.01,
-                confidence=0.5,
-                source="observed",
-                source_quote="test quote",
-            )
+            ExtractedSkill(**(_VALID_SKILL_KWARGS | {"proficiency": 1.01}))
 
 
 # ---------------------------------------------------------------------------
@@ -302,103 +279,159 @@ class TestExtractedInterest:
         assert interest.entity_name == "machine learning"
         assert interest.weight == 0.85
 
-    def test_interest_all_entity_types(self):
-        for etype in ("agent", "user", "service", "tool", "resource", "concept"):
-            interest = ExtractedInterest(
-                entity_name="test",
-                entity_type=etype,
-                weight=0.5,
-                source="explicit",
-                source_quote="test quote",
-            )
-            assert interest.entity_type == etype
-
-    def test_interest_all_sources(self):
-        for src in ("explicit", "implicit", "inferred"):
-            interest = ExtractedInterest(
-                entity_name="test",
-                entity_type="concept",
-                weight=0.5,
-                source=src,
-                source_quote="test quote",
-            )
-            assert interest.source == src
+    @pytest.mark.parametrize("etype", ("agent", "user", "service", "tool", "resource", "concept"))
+    def test_interest_all_entity_types(self, etype):
+        assert etype in get_args(ExtractedInterest.model_fields["entity_type"].annotation)
+
+    @pytest.mark.parametrize("src", ("explicit", "implicit", "inferred"))
+    def test_interest_all_sources(self, src):
+        assert src in get_args(ExtractedInterest.model_fields["source"].annotation)
+
+    def test_interest_non_default_literals_validate(self):
+        interest = ExtractedInterest(
+            **(_VALID_INTEREST_KWARGS | {"entity_type": "service", "source": "implicit"})
+        )
+        assert (interest.entity_type, interest.source) == ("service", "implicit")
 
     def test_interest_weight_out_of_range(self):
         with pytest.raises(ValidationError):
-            ExtractedInterest(
-                entity_name="test",
-                entity_type="concept",
-                weight=-0.5,
-                source="explicit",
-                source_quote="test quote",
-            )
+            ExtractedInterest(**(_VALID_INTEREST_KWARGS | {"weight": -0.5}))
 
 
 # ---------------------------------------------------------------------------
 # SessionExtractionResult
 # ---------------------------------------------------------------------------
 
+# Built once per module: the tests below only read these models (use
+# ``model_copy`` when a variant is needed) so re-validating them per test
+# is wasted work.  Each list adapter compiles its validator once.
+_ENTITY_LIST_ADAPTER = TypeAdapter(list[ExtractedEntity])
+_PREFERENCE_LIST_ADAPTER = TypeAdapter(list[ExtractedPreference])
+_SKILL_LIST_ADAPTER = TypeAdapter(list[ExtractedSkill])
+_INTEREST_LIST_ADAPTER = TypeAdapter(list[ExtractedInterest])
+
+
+@pytest.fixture(scope="module")
+def stripe_entity() -> ExtractedEntity:
+    return _ENTITY_LIST_ADAPTER.validate_python(
+        [
+            {
+                "name": "Stripe",
+                "entity_type": "service",
+                "confidence": 0.9,
+                "source_quote": "We use Stripe",
+            }
+        ]
+    )[0]
+
+
+@pytest.fixture(scope="module")
+def stripe_preference() -> ExtractedPreference:
+    return _PREFERENCE_LIST_ADAPTER.validate_python(
+        [
+            {
+                "category": "tool",
+                "key": "payment_processor",
+                "polarity": "positive",
+                "strength": 0.9,
+                "confidence": 0.85,
+                "source": "explicit",
+                "source_quote": "I prefer Stripe",
+            }
+        ]
+    )[0]
+
+
+@pytest.fixture(scope="module")
+def api_skill() -> ExtractedSkill:
+    return _SKILL_LIST_ADAPTER.validate_python(
+        [
+            {
+                "name": "API integration",
+                "category": "domain_knowledge",
+                "proficiency": 0.7,
+                "confidence": 0.8,
+                "source": "observed",
+                "source_quote": "integrated the payment API",
+            }
+        ]
+    )[0]
+
+
+@pytest.fixture(scope="module")
+def payments_interest() -> ExtractedInterest:
+    return _INTEREST_LIST_ADAPTER.validate_python(
+        [
+            {
+                "entity_name": "payments",
+                "entity_type": "concept",
+                "weight": 0.8,
+                "source": "implicit",
+                "source_quote": "asked about payment flows",
+            }
+        ]
+    )[0]
+
+
+@pytest.fixture(scope="module")
+def populated_result(
+    stripe_entity: ExtractedEntity,
+    stripe_preference: ExtractedPreference,
+    api_skill: ExtractedSkill,
+    payments_interest: ExtractedInterest,
+) -> SessionExtractionResult:
+    return SessionExtractionResult(
+        session_id="sess-001",
+        agent_id="agent-001",
+        model_id="gpt-4o",
+        prompt_version="v1.2",
+        entities=[stripe_entity],
+        preferences=[stripe_preference],
+        skills=[api_skill],
+        interests=[payments_interest],
+    )
+
 
 class TestSessionExtractionResult:
+    @pytest.mark.parametrize("field", ["entities", "preferences", "skills", "interests"])
+    def test_list_fields_default_empty(self, field):
+        default_factory = SessionExtractionResult.model_fields[field].default_factory
+        assert default_factory is not None
+        assert default_factory() == []
+
+    @pytest.mark.parametrize("field", ["model_id", "prompt_version"])
+    def test_optional_fields_default_none(self, field):
+        assert SessionExtractionResult.model_fields[field].default is None
+
     def test_empty_session_result(self):
+        # One real construction so defaults are checked end to end as well
         result = SessionExtractionResult(
             session_id="sess-001",
             agent_id="agent-001",
         )
         assert result.entities == []
-        assert result.preferences == []
-        assert result.skills == []
-        assert result.interests == []
         assert result.model_id is None
-        assert result.prompt_version is None
 
-    def test_populated_session_result(self):
-        entity = ExtractedEntity(
-            name="Stripe",
-            entity_type="service",
-            confidence=0.9,
-            source_quote="We use Stripe",
-        )
-        pref = ExtractedPreference(
-            category="tool",
-            key="payment_processor",
-            polarity="positive",
-            strength=0.9,
-            confidence=0.85,
-            source="explicit",
-            source_quote="I prefer Stripe",
-        )
-        skill = ExtractedSkill(
-            name="API integration",
-            category="domain_knowledge",
-            proficiency=0.7,
-            confidence=0.8,
-            source="observed",
-            source_quote="integrated the payment API",
-        )
-        interest = ExtractedInterest(
-            entity_name="payments",
-            entity_type="concept",
-            weight=0.8,
-            source="implicit",
-            source_quote="asked about payment flows",
-        )
-        result = SessionExtractionResult(
-            session_id="sess-001",
-            agent_id="agent-001",
-            model_id="gpt-4o",
-            prompt_version="v1.2",
-            entities=[entity],
-            preferences=[pref],
-            skills=[skill],
-            interests=[interest],
-        )
-        assert len(result.entities) == 1
-        assert len(result.preferences) == 1
-        assert len(result.skills) == 1
-        assert len(result.interests) == 1
-        assert result.model_id == "gpt-4o"
+    @pytest.mark.parametrize(
+        ("field", "item_fixture"),
+        [
+            ("entities", "stripe_entity"),
+            ("preferences", "stripe_preference"),
+            ("skills", "api_skill"),
+            ("interests", "payments_interest"),
+        ],
+    )
+    def test_populated_session_result(self, populated_result, field, item_fixture, request):
+        assert getattr(populated_result, field) == [request.getfixturevalue(item_fixture)]
+
+    def test_populated_session_result_metadata(self, populated_result):
+        assert populated_result.model_id == "gpt-4o"
+        assert populated_result.prompt_version == "v1.2"
+
+    def test_model_copy_leaves_shared_result_untouched(self, populated_result):
+        copied = populated_result.model_copy(update={"session_id": "sess-002"})
+        assert copied.session_id == "sess-002"
+        assert populated_result.session_id == "sess-001"
 
 
 # ---------------------------------------------------------------------------
@@ -434,6 +467,19 @@ class TestValidateSourceQuote:
         # Minor variation
         assert validate_source_quote("I really like using Python for data", text) is True
 
+    def test_normalization_collapses_and_strips_whitespace(self):
+        text = "  The User\t said\n\nI  PREFER\u00a0Slack  "
+        assert _normalize_text(text) == re.sub(r"\s+", " ", text.lower()).strip()
+        assert _normalize_text(text) == "the user said i prefer slack"
+
+    def test_prepared_conversation_matches_raw_text(self):
+        text = "The user   said I prefer Slack and   use Python daily."
+        conversation = normalize_conversation(text)
+        assert conversation.text == "the user said i prefer slack and use python daily."
+        assert "slack" in conversation.words
+        for quote in ("I prefer Slack", "use Python daily", "unrelated quote here", ""):
+            assert quote_in_conversation(quote, conversation) is validate_source_quote(quote, text)
+
 
 # ---------------------------------------------------------------------------
 # apply_confidence_prior
@@ -441,20 +487,19 @@ class TestValidateSourceQuote:
 
 
 class TestApplyConfidencePrior:
-    def test_explicit_cap(self):
-        assert apply_confidence_prior(1.0, "explicit") == 0.95
-
-    def test_implicit_intentional_cap(self):
-        assert apply_confidence_prior(0.9, "implicit_intentional") == 0.7
-
-    def test_implicit_unintentional_cap(self):
-        assert apply_confidence_prior(0.8, "implicit_unintentional") == 0.5
-
-    def test_below_cap_unchanged(self):
-        assert apply_confidence_prior(0.3, "explicit") == 0.3
-
-    def test_unknown_source_passthrough(self):
-        assert apply_confidence_prior(0.99, "unknown_source") == 0.99
+    @pytest.mark.parametrize(
+        ("raw_confidence", "source", "expected"),
+        [
+            (1.0, "explicit", 0.95),
+            (0.9, "implicit_intentional", 0.7),
+            (0.8, "implicit_unintentional", 0.5),
+            (0.3, "explicit", 0.3),
+            (0.99, "unknown_source", 0.99),
+        ],
+        ids=["explicit_cap", "intentional_cap", "unintentional_cap", "below_cap", "unknown"],
+    )
+    def test_confidence_prior(self, raw_confidence, source, expected):
+        assert apply_confidence_prior(raw_confidence, source) == expected
 
     def test_confidence_ceilings_has_expected_keys(self):
         assert "explicit" in CONFIDENCE_CEILINGS
@@ -489,6 +534,30 @@ class TestSourceQuoteThreshold060:
         assert validate_source_quote("hello world abc", text) is True
 
 
+class TestSourceQuoteWindowBoundary:
+    """The 0.6 threshold against the stepped SequenceMatcher window scan."""
+
+    def test_window_at_threshold_accepted(self):
+        # "abcde" vs window "abcxx": 2 * 3 / 10 == 0.6
+        assert validate_source_quote("abcde", "zz abcxx zz") is True
+
+    def test_window_below_threshold_rejected(self):
+        assert validate_source_quote("abcde", "zz abxxx zz") is False
+
+    def test_unsupported_claim_sharing_a_phrase_rejected(self):
+        # rapidfuzz partial_ratio scores this >= 0.6 on the shared
+        # "platform team" alignment; the window scan rejects it.
+        text = (
+            "I mostly write backend services in Go and deploy them on Kubernetes "
+            "clusters every week with our platform team"
+        )
+        assert validate_source_quote("platform team writes in Rust", text) is False
+
+    def test_quote_longer_than_text_not_partially_matched(self):
+        # partial_ratio would align the text inside the quote; keep full ratio
+        assert validate_source_quote("the quick brown fox jumps", "fox") is False
+
+
 # ---------------------------------------------------------------------------
 # verify_entailment (keyword overlap heuristic)
 # ---------------------------------------------------------------------------
@@ -6,20 +6,30 @@ dispatch. Uses mocked Redis and Neo4j dependencies.
 
 from __future__ import annotations
 
-from typing import Any
+import inspect
+from collections import defaultdict
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock
 
 import orjson
+import pytest
 
 from context_graph.worker.consumer import BaseConsumer
 from context_graph.worker.extraction import ExtractionConsumer
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# The async tests only await mocks, so they share one event loop per module.
+_module_loop = pytest.mark.asyncio(loop_scope="module")
+
 # ---------------------------------------------------------------------------
 # Stubs / Helpers
 # ---------------------------------------------------------------------------
 
 
-def _make_settings() -> Any:
+def _build_settings() -> Any:
     """Create a minimal Settings-like object for ExtractionConsumer."""
     settings = MagicMock()
     settings.redis.group_extraction = "session-extraction"
@@ -29,6 +39,12 @@ def _make_settings() -> Any:
     return settings
 
 
+@lru_cache(maxsize=1)
+def _make_settings() -> Any:
+    """Shared read-only settings; tests that customize settings use ``_build_settings``."""
+    return _build_settings()
+
+
 def _make_consumer(
     redis_client: Any = None,
     llm_client: Any = None,
@@ -47,6 +63,42 @@ def _make_consumer(
     )
 
 
+# Per-session stream entry as redis-py returns it (bytes keys and values).
+_FAKE_STREAM_ENTRY: tuple[bytes, dict[bytes, bytes]] = (b"1234-0", {b"event_id": b"evt-001"})
+
+
+class _FakeRedis:
+    """Plain-coroutine Redis stand-in for tests that never inspect call args.
+
+    Cheaper per call than ``AsyncMock``; use ``AsyncMock`` when a test asserts
+    on how Redis was called.
+    """
+
+    def __init__(
+        self,
+        json_doc: bytes | None = None,
+        stream_entries: list[tuple[bytes, dict[bytes, bytes]]] | None = None,
+    ) -> None:
+        self._json_doc = json_doc
+        self._stream_entries = stream_entries or []
+
+    async def execute_command(self, *args: Any, **kwargs: Any) -> bytes | None:
+        return self._json_doc
+
+    async def xrange(self, *args: Any, **kwargs: Any) -> list[tuple[bytes, dict[bytes, bytes]]]:
+        return self._stream_entries
+
+
+@cache
+def _signature(fn: Callable[..., Any]) -> inspect.Signature:
+    """Memoized ``inspect.signature`` for signature-shape assertions.
+
+    Pass the function from the class, not a bound method: bound methods are
+    new objects on every access and would never hit the cache.
+    """
+    return inspect.signature(fn)
+
+
 def _mock_json_doc(
     event_id: str,
     event_type: str,
@@ -88,21 +140,20 @@ class TestExtractionConsumerStructure:
         assert consumer._stream_key == "events:__global__"
 
 
+@_module_loop
 class TestProcessMessage:
     async def test_ignores_non_session_end_events(self) -> None:
         llm_client = AsyncMock()
-        redis_client = AsyncMock()
-        redis_client.execute_command.return_value = _mock_json_doc("evt-001", "tool.execute", "s1")
+        redis_client = _FakeRedis(_mock_json_doc("evt-001", "tool.execute", "s1"))
 
         consumer = _make_consumer(redis_client=redis_client, llm_client=llm_client)
 
         await consumer.process_message("1234-0", {"event_id": "evt-001"})
 
-        llm_client.extract_from_session.assert_not_called()
+        assert llm_client.extract_from_session.call_count == 0
 
     async def test_ignores_session_end_without_session_id(self) -> None:
         llm_client = AsyncMock()
-        redis_client = AsyncMock()
         # Doc with no session_id
         doc = {
             "event_id": "evt-001",
@@ -112,13 +163,13 @@ class TestProcessMessage:
             "trace_id": "trace-1",
             "payload_ref": "inline:session_end",
         }
-        redis_client.execute_command.return_value = orjson.dumps([doc])
+        redis_client = _FakeRedis(orjson.dumps([doc]))
 
         consumer = _make_consumer(redis_client=redis_client, llm_client=llm_client)
 
         await consumer.process_message("1234-0", {"event_id": "evt-001"})
 
-        llm_client.extract_from_session.assert_not_called()
+        assert llm_client.extract_from_session.call_count == 0
 
     async def test_triggers_extraction_on_session_end(self) -> None:
         llm_client = AsyncMock()
@@ -146,15 +197,11 @@ class TestProcessMessage:
         )
 
         # xrange is called to collect session events
-        redis_client.xrange.assert_called_once()
+        assert redis_client.xrange.await_count == 1
 
     async def test_skips_extraction_when_no_events(self) -> None:
         llm_client = AsyncMock()
-        redis_client = AsyncMock()
-        redis_client.xrange.return_value = []
-        redis_client.execute_command.return_value = _mock_json_doc(
-            "evt-end", "system.session_end", "sess-empty"
-        )
+        redis_client = _FakeRedis(_mock_json_doc("evt-end", "system.session_end", "sess-empty"))
 
         consumer = _make_consumer(redis_client=redis_client, llm_client=llm_client)
 
@@ -163,7 +210,7 @@ class TestProcessMessage:
             {"event_id": "evt-end"},
         )
 
-        llm_client.extract_from_session.assert_not_called()
+        assert llm_client.extract_from_session.call_count == 0
 
     async def test_writes_preferences_to_neo4j(self) -> None:
         llm_client = AsyncMock()
@@ -188,14 +235,7 @@ class TestProcessMessage:
 
         redis_client = AsyncMock()
         # Return one matching event in the stream
-        redis_client.xrange.return_value = [
-            (
-                b"1234-0",
-                {
-                    b"event_id": b"evt-001",
-                },
-            ),
-        ]
+        redis_client.xrange.return_value = [_FAKE_STREAM_ENTRY]
 
         def _execute_command_side_effect(*args: Any, **kwargs: Any) -> Any:
             # First call from process_message: fetch session_end doc
@@ -216,12 +256,10 @@ class TestProcessMessage:
             {"event_id": "evt-end"},
         )
         # No events found => extract_from_session not called
-        llm_client.extract_from_session.assert_not_called()
+        assert llm_client.extract_from_session.call_count == 0
 
     async def test_handles_empty_agent_id(self) -> None:
         llm_client = AsyncMock()
-        redis_client = AsyncMock()
-        redis_client.xrange.return_value = []
         doc = {
             "event_id": "evt-end",
             "event_type": "system.session_end",
@@ -230,7 +268,7 @@ class TestProcessMessage:
             "trace_id": "trace-1",
             "payload_ref": "inline:session_end",
         }
-        redis_client.execute_command.return_value = orjson.dumps([doc])
+        redis_client = _FakeRedis(orjson.dumps([doc]))
 
         consumer = _make_consumer(redis_client=redis_client, llm_client=llm_client)
 
@@ -240,6 +278,19 @@ class TestProcessMessage:
             {"event_id": "evt-end"},
         )
 
+    async def test_collects_events_from_bytes_and_str_stream_entries(self) -> None:
+        event_uuid = "00000000-0000-4000-8000-000000000001"
+        redis_client = _FakeRedis(
+            _mock_json_doc(event_uuid, "tool.execute", "sess-1"),
+            stream_entries=[_FAKE_STREAM_ENTRY, ("1235-0", {"event_id": "evt-001"})],
+        )
+        consumer = _make_consumer(redis_client=redis_client)
+
+        events, raw_docs = await consumer._collect_session_events("sess-1")
+
+        assert len(events) == 2
+        assert len(raw_docs) == 2
+
     async def test_ignores_missing_event_id(self) -> None:
         consumer = _make_consumer()
         # Should not raise when event_id is missing from stream data
@@ -251,6 +302,7 @@ class TestProcessMessage:
 # ---------------------------------------------------------------------------
 
 
+@_module_loop
 class TestMidSessionExtraction:
     async def test_mid_session_extraction_trigger(self) -> None:
         """Non-system events should increment turn count and trigger at interval."""
@@ -263,18 +315,15 @@ class TestMidSessionExtraction:
             "skills": [],
             "interests": [],
         }
-        redis_client = AsyncMock()
-        redis_client.xrange.return_value = []
-
-        # Mock JSON.GET to return tool.execute event docs
-        def _mock_execute(*args: Any, **kwargs: Any) -> bytes:
-            return _mock_json_doc("evt-turn", "tool.execute", "s1", "a1")
-
-        redis_client.execute_command.side_effect = _mock_execute
+        # JSON.GET returns a tool.execute event doc for every turn
+        redis_client = _FakeRedis(_mock_json_doc("evt-turn", "tool.execute", "s1", "a1"))
 
         consumer = _make_consumer(redis_client=redis_client, llm_client=llm_client)
         consumer._mid_session_interval = 2  # trigger every 2 turns
 
+        # Counts start at zero without a get-and-set round trip
+        assert isinstance(consumer._session_turn_counts, defaultdict)
+
         # First turn - should not trigger
         await consumer.process_message("1-0", {"event_id": "evt-1"})
         assert consumer._session_turn_counts.get("s1") == 1
@@ -289,14 +338,12 @@ class TestMidSessionExtraction:
 # ---------------------------------------------------------------------------
 
 
+@_module_loop
 class TestSourceEventIdsInResults:
     async def test_derived_from_passes_source_event_ids(self) -> None:
         """_write_extraction_results should receive source event IDs."""
-        consumer = _make_consumer()
         # Verify the method signature accepts source_event_ids
-        import inspect
-
-        sig = inspect.signature(consumer._write_extraction_results)
+        sig = _signature(ExtractionConsumer._write_extraction_results)
         assert "source_event_ids" in sig.parameters
 
 
@@ -305,6 +352,7 @@ class TestSourceEventIdsInResults:
 # ---------------------------------------------------------------------------
 
 
+@_module_loop
 class TestEntityEmbeddingOnNeo4j:
     async def test_merge_entity_node_passes_embedding(self) -> None:
         """_merge_entity_node should pass embedding param to GraphStore."""
@@ -353,7 +401,7 @@ class TestEntityEmbeddingOnNeo4j:
         graph_store = AsyncMock()
         graph_store.search_similar_entities.return_value = []
 
-        settings = _make_settings()
+        settings = _build_settings()
         settings.embedding.knn_k = 10
         settings.embedding.same_as_threshold = 0.90
         settings.embedding.related_to_threshold = 0.75
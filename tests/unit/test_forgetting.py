@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
+from context_graph.domain import forgetting
 from context_graph.domain.forgetting import (
     PruningActions,
     classify_retention_tier,
@@ -13,6 +15,9 @@ from context_graph.domain.forgetting import (
 )
 from context_graph.domain.models import RetentionTier
 
+if TYPE_CHECKING:
+    import pytest
+
 # ---------------------------------------------------------------------------
 # classify_retention_tier
 # ---------------------------------------------------------------------------
@@ -62,6 +67,16 @@ class TestClassifyRetentionTier:
         occurred = now - timedelta(hours=720)
         assert classify_retention_tier(occurred, now=now) == RetentionTier.ARCHIVE
 
+    def test_one_microsecond_inside_boundary(self):
+        now = self._now()
+        tick = timedelta(microseconds=1)
+        assert classify_retention_tier(now - timedelta(hours=24) + tick, now=now) == (
+            RetentionTier.HOT
+        )
+        assert classify_retention_tier(now - timedelta(hours=720) + tick, now=now) == (
+            RetentionTier.COLD
+        )
+
     def test_custom_boundaries(self):
         now = self._now()
         occurred = now - timedelta(hours=5)
@@ -239,6 +254,55 @@ class TestGetPruningActions:
         actions = get_pruning_actions(events, now=now)
         assert actions.archive_event_ids == []
 
+    def test_missing_event_id_not_parsed(self):
+        # Events without an ID are dropped before their timestamp is read
+        events = [{"occurred_at": "not-a-timestamp"}]
+        actions = get_pruning_actions(events, now=self._now())
+        assert actions == PruningActions()
+
+    def test_batch_tiers_match_single_classification_at_boundaries(self):
+        now = self._now()
+        # Low-quality events so every non-HOT tier yields exactly one action
+        hours = (0, 23, 24, 25, 167, 168, 169, 719, 720, 721)
+        events = [
+            self._make_event(str(h), hours_ago=h, importance=0, similarity_score=0.0) for h in hours
+        ]
+        expected = PruningActions()
+        targets = {
+            RetentionTier.WARM: expected.delete_edges,
+            RetentionTier.COLD: expected.delete_nodes,
+            RetentionTier.ARCHIVE: expected.archive_event_ids,
+        }
+        for h in hours:
+            tier = classify_retention_tier(now - timedelta(hours=h), now=now)
+            if tier in targets:
+                targets[tier].append(str(h))
+
+        assert get_pruning_actions(events, now=now) == expected
+
+    def test_prune_rules_only_see_their_own_tier(self, monkeypatch: pytest.MonkeyPatch):
+        seen: list[tuple[str, str]] = []
+
+        def record(rule: str):
+            def predicate(event, **_kwargs):
+                seen.append((rule, event["event_id"]))
+                return False
+
+            return predicate
+
+        monkeypatch.setattr(forgetting, "should_prune_warm", record("warm"))
+        monkeypatch.setattr(forgetting, "should_prune_cold", record("cold"))
+        events = [
+            self._make_event("hot", hours_ago=1),
+            self._make_event("warm", hours_ago=48),
+            self._make_event("cold", hours_ago=200),
+            self._make_event("archive", hours_ago=800),
+        ]
+        actions = get_pruning_actions(events, now=self._now())
+
+        assert seen == [("warm", "warm"), ("cold", "cold")]
+        assert actions.archive_event_ids == ["archive"]
+
     def test_datetime_objects_supported(self):
         now = self._now()
         events = [
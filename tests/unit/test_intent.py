@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import re
+
 from context_graph.domain.intent import (
+    _INTENT_KEYWORDS,
     classify_intent,
     get_edge_weights,
     select_seed_strategy,
@@ -86,6 +89,29 @@ class TestClassifyIntent:
         max_score = max(result.values())
         assert abs(max_score - 1.0) < 1e-6
 
+    def test_cached_result_not_shared_between_calls(self) -> None:
+        """Mutating a returned dict must not leak into later calls for the same query."""
+        first = classify_intent("why did the build fail?")
+        first[IntentType.WHY] = 0.0
+        first["extra"] = 1.0
+        assert classify_intent("why did the build fail?") == {IntentType.WHY: 1.0}
+
+    def test_repeated_keyword_counts_once(self) -> None:
+        """Each keyword counts once however often it appears."""
+        assert classify_intent("why why why, because") == classify_intent("why because")
+
+    def test_no_keyword_nested_in_another(self) -> None:
+        """The single-pass scanner relies on no keyword being a whole word of another."""
+        keywords = [kw for kws in _INTENT_KEYWORDS.values() for kw in kws]
+        assert len(keywords) == len(set(keywords))
+        nested = [
+            (outer, inner)
+            for outer in keywords
+            for inner in keywords
+            if outer != inner and re.search(rf"\b{re.escape(inner)}\b", outer)
+        ]
+        assert nested == []
+
 
 class TestGetEdgeWeights:
     """Tests for edge weight computation from intents."""
@@ -124,6 +124,12 @@ class TestBuildLineageCypher:
         assert "chain_nodes" in cypher
         assert "chain_rels" in cypher
 
+    def test_equal_edge_type_lists_share_cached_query(self) -> None:
+        """Edge types are keyed by value, so separate but equal lists hit one cache entry."""
+        first = build_lineage_cypher(edge_types=["CAUSED_BY", "FOLLOWS"])
+        second = build_lineage_cypher(edge_types=["CAUSED_BY", "FOLLOWS"])
+        assert first is second
+
 
 class TestBuildContextCypher:
     """Tests for context assembly Cypher query."""
@@ -7,6 +7,8 @@ the extract_from_session fallback behavior.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from context_graph.adapters.llm.client import (
@@ -25,19 +27,43 @@ from context_graph.domain.extraction import (
 )
 from tests.fixtures.events import make_event, make_session_events, make_tool_event
 
+if TYPE_CHECKING:
+    from context_graph.domain.models import Event
+
 # ---------------------------------------------------------------------------
 # build_extraction_prompt
 # ---------------------------------------------------------------------------
 
 
+# Session events are built once per module; none of the functions under test
+# mutate the event list or the events themselves.
+@pytest.fixture(scope="module")
+def events1() -> list[Event]:
+    return make_session_events(n=1)
+
+
+@pytest.fixture(scope="module")
+def events2() -> list[Event]:
+    return make_session_events(n=2)
+
+
+@pytest.fixture(scope="module")
+def events3() -> list[Event]:
+    return make_session_events(n=3)
+
+
+@pytest.fixture(scope="module")
+def base_prompt(events2: list[Event]) -> str:
+    return build_extraction_prompt(events2, existing_entities=[])
+
+
 class TestBuildExtractionPrompt:
-    def test_prompt_contains_schema_info(self) -> None:
-        events = make_session_events(n=2)
-        prompt = build_extraction_prompt(events, existing_entities=[])
-        assert "Entity Types" in prompt
-        assert "Preference Categories" in prompt
-        assert "Skill Categories" in prompt
-        assert "Output Format" in prompt
+    @pytest.mark.parametrize(
+        "section",
+        ["Entity Types", "Preference Categories", "Skill Categories", "Output Format"],
+    )
+    def test_prompt_contains_schema_info(self, base_prompt: str, section: str) -> None:
+        assert section in base_prompt
 
     def test_prompt_contains_event_data(self) -> None:
         events = [make_tool_event(tool_name="my-tool")]
@@ -45,23 +71,19 @@ class TestBuildExtractionPrompt:
         assert "my-tool" in prompt
         assert "tool.execute" in prompt
 
-    def test_prompt_includes_existing_entities(self) -> None:
-        events = make_session_events(n=1)
+    def test_prompt_includes_existing_entities(self, events1: list[Event]) -> None:
         existing = [{"name": "python"}, {"name": "redis"}]
-        prompt = build_extraction_prompt(events, existing_entities=existing)
+        prompt = build_extraction_prompt(events1, existing_entities=existing)
         assert "python" in prompt
         assert "redis" in prompt
         assert "Existing Entities" in prompt
 
-    def test_prompt_skips_empty_existing_entities(self) -> None:
-        events = make_session_events(n=1)
-        prompt = build_extraction_prompt(events, existing_entities=[])
-        assert "Existing Entities" not in prompt
+    def test_prompt_skips_empty_existing_entities(self, base_prompt: str) -> None:
+        assert "Existing Entities" not in base_prompt
 
-    def test_prompt_skips_entities_without_names(self) -> None:
-        events = make_session_events(n=1)
+    def test_prompt_skips_entities_without_names(self, events1: list[Event]) -> None:
         existing = [{"name": ""}, {"type": "tool"}]
-        prompt = build_extraction_prompt(events, existing_entities=existing)
+        prompt = build_extraction_prompt(events1, existing_entities=existing)
         assert "Existing Entities" not in prompt
 
 
@@ -71,9 +93,8 @@ class TestBuildExtractionPrompt:
 
 
 class TestBuildConversationText:
-    def test_reconstructs_from_events(self) -> None:
-        events = make_session_events(n=3)
-        text = build_conversation_text(events)
+    def test_reconstructs_from_events(self, events3: list[Event]) -> None:
+        text = build_conversation_text(events3)
         assert "[Turn 0]" in text
         assert "[Turn 1]" in text
         assert "[Turn 2]" in text
@@ -147,130 +168,112 @@ class TestTryParseInlinePayload:
 # ---------------------------------------------------------------------------
 
 
-class TestValidateExtraction:
-    def _make_result(self, **kwargs) -> SessionExtractionResult:
-        defaults = {
-            "session_id": "sess-1",
-            "agent_id": "agent-1",
-            "entities": [],
-            "preferences": [],
-            "skills": [],
-            "interests": [],
-        }
-        defaults.update(kwargs)
-        return SessionExtractionResult(**defaults)
+# One conversation backs every valid quote below; each invalid quote shares no
+# significant words with it, so all cases are checked by a single validation.
+_VALIDATION_CONVERSATION = (
+    "I love python programming and use it daily. "
+    "I was using vim for editing the file. "
+    "The user wrote python code to process the data. "
+    "I am really interested in docker containers before deploying to production server."
+)
 
-    def test_filters_invalid_entity_quotes(self) -> None:
-        result = self._make_result(
-            entities=[
-                ExtractedEntity(
-                    name="python",
-                    entity_type="concept",
-                    confidence=0.9,
-                    source_quote="I love python programming",
-                ),
-                ExtractedEntity(
-                    name="rust",
-                    entity_type="concept",
-                    confidence=0.8,
-                    source_quote="this quote does not exist in conversation",
-                ),
-            ]
-        )
-        conversation = "I love python programming and use it daily"
-        validated = validate_extraction(result, conversation)
-        assert len(validated.entities) == 1
-        assert validated.entities[0].name == "python"
 
-    def test_applies_confidence_prior_to_preferences(self) -> None:
-        result = self._make_result(
-            preferences=[
-                ExtractedPreference(
-                    category="tool",
-                    key="vim",
-                    polarity="positive",
-                    strength=0.9,
-                    confidence=0.99,
-                    source="implicit_unintentional",
-                    source_quote="using vim for editing",
-                ),
-            ]
-        )
-        conversation = "I was using vim for editing the file"
-        validated = validate_extraction(result, conversation)
+@pytest.fixture(scope="module")
+def validated() -> SessionExtractionResult:
+    result = SessionExtractionResult(
+        session_id="sess-1",
+        agent_id="agent-1",
+        entities=[
+            ExtractedEntity.model_construct(
+                name="python",
+                entity_type="concept",
+                confidence=0.9,
+                source_quote="I love python programming",
+            ),
+            ExtractedEntity.model_construct(
+                name="rust",
+                entity_type="concept",
+                confidence=0.8,
+                source_quote="this quote does not exist in conversation",
+            ),
+        ],
+        preferences=[
+            ExtractedPreference.model_construct(
+                category="tool",
+                key="vim",
+                polarity="positive",
+                strength=0.9,
+                confidence=0.99,
+                source="implicit_unintentional",
+                source_quote="using vim for editing",
+            ),
+        ],
+        skills=[
+            ExtractedSkill.model_construct(
+                name="Python",
+                category="programming_language",
+                proficiency=0.8,
+                confidence=0.95,
+                source="inferred",
+                source_quote="wrote python code",
+            ),
+            ExtractedSkill.model_construct(
+                name="Go",
+                category="programming_language",
+                proficiency=0.7,
+                confidence=0.8,
+                source="observed",
+                source_quote="completely fabricated quote",
+            ),
+        ],
+        interests=[
+            ExtractedInterest.model_construct(
+                entity_name="docker",
+                entity_type="tool",
+                weight=0.9,
+                source="explicit",
+                source_quote="really interested in docker",
+            ),
+            ExtractedInterest.model_construct(
+                entity_name="kubernetes",
+                entity_type="tool",
+                weight=0.8,
+                source="explicit",
+                source_quote="nonexistent quote about k8s",
+            ),
+        ],
+    )
+    return validate_extraction(result, _VALIDATION_CONVERSATION)
+
+
+class TestValidateExtraction:
+    def test_filters_invalid_entity_quotes(self, validated: SessionExtractionResult) -> None:
+        assert [e.name for e in validated.entities] == ["python"]
+
+    def test_applies_confidence_prior_to_preferences(
+        self, validated: SessionExtractionResult
+    ) -> None:
         assert len(validated.preferences) == 1
         # implicit_unintentional ceiling is 0.5
         assert validated.preferences[0].confidence <= 0.5
 
-    def test_applies_confidence_prior_to_skills(self) -> None:
-        result = self._make_result(
-            skills=[
-                ExtractedSkill(
-                    name="Python",
-                    category="programming_language",
-                    proficiency=0.8,
-                    confidence=0.95,
-                    source="inferred",
-                    source_quote="wrote python code",
-                ),
-            ]
-        )
-        conversation = "The user wrote python code to process the data"
-        validated = validate_extraction(result, conversation)
-        assert len(validated.skills) == 1
+    def test_applies_confidence_prior_to_skills(self, validated: SessionExtractionResult) -> None:
+        python_skills = [s for s in validated.skills if s.name == "Python"]
+        assert len(python_skills) == 1
         # inferred ceiling is 0.6
-        assert validated.skills[0].confidence <= 0.6
-
-    def test_filters_invalid_skill_quotes(self) -> None:
-        result = self._make_result(
-            skills=[
-                ExtractedSkill(
-                    name="Go",
-                    category="programming_language",
-                    proficiency=0.7,
-                    confidence=0.8,
-                    source="observed",
-                    source_quote="completely fabricated quote",
-                ),
-            ]
-        )
-        conversation = "working on the python project"
-        validated = validate_extraction(result, conversation)
-        assert len(validated.skills) == 0
-
-    def test_filters_invalid_interest_quotes(self) -> None:
-        result = self._make_result(
-            interests=[
-                ExtractedInterest(
-                    entity_name="kubernetes",
-                    entity_type="tool",
-                    weight=0.8,
-                    source="explicit",
-                    source_quote="nonexistent quote about k8s",
-                ),
-            ]
-        )
-        conversation = "deploying to production server"
-        validated = validate_extraction(result, conversation)
-        assert len(validated.interests) == 0
-
-    def test_valid_interest_preserved(self) -> None:
-        result = self._make_result(
-            interests=[
-                ExtractedInterest(
-                    entity_name="docker",
-                    entity_type="tool",
-                    weight=0.9,
-                    source="explicit",
-                    source_quote="really interested in docker",
-                ),
-            ]
-        )
-        conversation = "I am really interested in docker containers"
-        validated = validate_extraction(result, conversation)
-        assert len(validated.interests) == 1
+        assert python_skills[0].confidence <= 0.6
+
+    def test_filters_invalid_skill_quotes(self, validated: SessionExtractionResult) -> None:
+        assert "Go" not in {s.name for s in validated.skills}
+
+    def test_filters_invalid_interest_quotes(self, validated: SessionExtractionResult) -> None:
+        assert "kubernetes" not in {i.entity_name for i in validated.interests}
+
+    def test_valid_interest_preserved(self, validated: SessionExtractionResult) -> None:
+        docker = [i for i in validated.interests if i.entity_name == "docker"]
+        assert len(docker) == 1
         # explicit ceiling is 0.95, weight 0.9 stays
-        assert validated.interests[0].weight <= 0.95
+        assert docker[0].weight <= 0.95
 
 
 # ---------------------------------------------------------------------------
@@ -278,13 +281,18 @@ class TestValidateExtraction:
 # ---------------------------------------------------------------------------
 
 
-class TestLLMExtractionClient:
-    @pytest.fixture()
-    def client(self) -> LLMExtractionClient:
-        return LLMExtractionClient(model_id="test-model", prompt_version="v1")
+# Shared across the module: the tests only call extract_from_session on the
+# no-LLM fallback path, which never mutates the client.
+@pytest.fixture(scope="module")
+def fallback_client() -> LLMExtractionClient:
+    return LLMExtractionClient(model_id="test-model", prompt_version="v1")
+
 
-    async def test_returns_empty_when_no_events(self, client: LLMExtractionClient) -> None:
-        result = await client.extract_from_session(
+# The fallback-path tests share one event loop instead of one per test.
+@pytest.mark.asyncio(loop_scope="module")
+class TestLLMExtractionClient:
+    async def test_returns_empty_when_no_events(self, fallback_client: LLMExtractionClient) -> None:
+        result = await fallback_client.extract_from_session(
             events=[], session_id="sess-1", agent_id="agent-1"
         )
         assert result["session_id"] == "sess-1"
@@ -294,17 +302,21 @@ class TestLLMExtractionClient:
         assert result["skills"] == []
         assert result["interests"] == []
 
-    async def test_returns_empty_when_llm_unavailable(self, client: LLMExtractionClient) -> None:
-        events = make_session_events(n=3)
-        result = await client.extract_from_session(
-            events=events, session_id="sess-2", agent_id="agent-2"
+    async def test_returns_empty_when_llm_unavailable(
+        self, fallback_client: LLMExtractionClient, events3: list[Event]
+    ) -> None:
+        result = await fallback_client.extract_from_session(
+            events=events3, session_id="sess-2", agent_id="agent-2"
         )
         assert result["session_id"] == "sess-2"
         assert result["entities"] == []
 
-    async def test_result_contains_expected_keys(self, client: LLMExtractionClient) -> None:
-        events = make_session_events(n=1)
-        result = await client.extract_from_session(events=events, session_id="s", agent_id="a")
+    async def test_result_contains_expected_keys(
+        self, fallback_client: LLMExtractionClient, events1: list[Event]
+    ) -> None:
+        result = await fallback_client.extract_from_session(
+            events=events1, session_id="s", agent_id="a"
+        )
         expected_keys = {
             "session_id",
             "agent_id",
@@ -315,7 +327,7 @@ class TestLLMExtractionClient:
             "skills",
             "interests",
         }
-        assert expected_keys.issubset(set(result.keys()))
+        assert expected_keys <= result.keys()
 
 
 # ---------------------------------------------------------------------------
@@ -404,11 +416,9 @@ class TestGenerateText:
 
 
 class TestPromptXmlWrapper:
-    def test_prompt_has_xml_conversation_wrapper(self) -> None:
-        events = make_session_events(n=2)
-        prompt = build_extraction_prompt(events, existing_entities=[])
-        assert "<conversation>" in prompt
-        assert "</conversation>" in prompt
+    def test_prompt_has_xml_conversation_wrapper(self, base_prompt: str) -> None:
+        assert "<conversation>" in base_prompt
+        assert "</conversation>" in base_prompt
 
 
 # ---------------------------------------------------------------------------
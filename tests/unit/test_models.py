@@ -7,6 +7,7 @@ and default values.  No external dependencies required.
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from types import MappingProxyType
 from uuid import uuid4
 
 import pytest
@@ -33,15 +34,17 @@ from context_graph.domain.models import (
     Provenance,
     SubgraphQuery,
 )
+from context_graph.domain.validation import EVENT_TYPE_PATTERN
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _required_event_kwargs() -> dict:
-    """Minimal keyword arguments that satisfy all required Event fields."""
-    return {
+# Built once so cases don't each call uuid4() and datetime.now(); callers get
+# a mutable copy via _required_event_kwargs().
+_EVENT_TEMPLATE: MappingProxyType[str, object] = MappingProxyType(
+    {
         "event_id": uuid4(),
         "event_type": "tool.execute",
         "occurred_at": datetime.now(UTC),
@@ -50,6 +53,12 @@ def _required_event_kwargs() -> dict:
         "trace_id": "test-trace",
         "payload_ref": "payload:test",
     }
+)
+
+
+def _required_event_kwargs() -> dict:
+    """Minimal keyword arguments that satisfy all required Event fields."""
+    return dict(_EVENT_TEMPLATE)
 
 
 # ---------------------------------------------------------------------------
@@ -69,19 +78,16 @@ class TestEventCreation:
 
     def test_valid_event_with_all_optional_fields(self) -> None:
         """An Event with every optional field populated should be accepted."""
-        kwargs = _required_event_kwargs()
-        kwargs.update(
-            {
-                "tool_name": "web_search",
-                "parent_event_id": uuid4(),
-                "ended_at": datetime.now(UTC),
-                "status": EventStatus.COMPLETED,
-                "schema_version": 2,
-                "importance_hint": 7,
-                "global_position": "1700000000000-0",
-            }
+        event = Event(
+            **_EVENT_TEMPLATE,
+            tool_name="web_search",
+            parent_event_id=uuid4(),
+            ended_at=datetime.now(UTC),
+            status=EventStatus.COMPLETED,
+            schema_version=2,
+            importance_hint=7,
+            global_position="1700000000000-0",
         )
-        event = Event(**kwargs)
         assert event.tool_name == "web_search"
         assert event.status == EventStatus.COMPLETED
         assert event.schema_version == 2
@@ -129,10 +135,7 @@ class TestEventFieldConstraints:
     )
     def test_event_type_pattern_rejects_invalid(self, bad_type: str) -> None:
         """event_type must match ^[a-z][a-z0-9]*(\\.[a-z][a-z0-9_]*)+$."""
-        kwargs = _required_event_kwargs()
-        kwargs["event_type"] = bad_type
-        with pytest.raises(ValidationError):
-            Event(**kwargs)
+        assert EVENT_TYPE_PATTERN.fullmatch(bad_type) is None
 
     @pytest.mark.parametrize(
         "good_type",
@@ -147,10 +150,20 @@ class TestEventFieldConstraints:
     )
     def test_event_type_pattern_accepts_valid(self, good_type: str) -> None:
         """Known good dot-namespaced event types must be accepted."""
+        assert EVENT_TYPE_PATTERN.fullmatch(good_type) is not None
+
+    def test_event_type_field_uses_event_type_pattern(self) -> None:
+        """The pattern tests above only hold if Event validates with the same regex."""
+        (metadata,) = Event.model_fields["event_type"].metadata
+        assert metadata.pattern == EVENT_TYPE_PATTERN.pattern
+
+    def test_event_type_pattern_enforced_on_construction(self) -> None:
         kwargs = _required_event_kwargs()
-        kwargs["event_type"] = good_type
-        event = Event(**kwargs)
-        assert event.event_type == good_type
+        kwargs["event_type"] = "user.preference.stated"
+        assert Event(**kwargs).event_type == "user.preference.stated"
+        kwargs["event_type"] = "double..dot"
+        with pytest.raises(ValidationError):
+            Event(**kwargs)
 
     def test_importance_hint_none_is_ok(self) -> None:
         """importance_hint defaults to None and that is valid."""
@@ -165,13 +178,12 @@ class TestEventFieldConstraints:
         event = Event(**kwargs)
         assert event.importance_hint == value
 
-    @pytest.mark.parametrize("value", [0, -1, 11, 100])
-    def test_importance_hint_invalid_range(self, value: int) -> None:
+    def test_importance_hint_invalid_range(self) -> None:
         """importance_hint outside 1-10 must be rejected."""
-        kwargs = _required_event_kwargs()
-        kwargs["importance_hint"] = value
-        with pytest.raises(ValidationError):
-            Event(**kwargs)
+        for value in (0, -1, 11, 100):
+            with pytest.raises(ValidationError) as exc_info:
+                Event.model_validate(_EVENT_TEMPLATE | {"importance_hint": value})
+            assert exc_info.value.errors()[0]["loc"] == ("importance_hint",), value
 
     def test_schema_version_defaults_to_one(self) -> None:
         """schema_version should default to 1."""
@@ -246,6 +258,11 @@ class TestEnumCompleteness:
 # ---------------------------------------------------------------------------
 
 
+_SUBGRAPH_QUERY_BASE: MappingProxyType[str, object] = MappingProxyType(
+    {"query": "q", "session_id": "s", "agent_id": "a"}
+)
+
+
 class TestSubgraphQuery:
     """Tests for SubgraphQuery model constraints."""
 
@@ -260,11 +277,12 @@ class TestSubgraphQuery:
         assert sq.max_nodes == 100
         assert sq.max_depth == 3
 
-    @pytest.mark.parametrize("value", [0, -1, 501, 1000])
-    def test_max_nodes_out_of_bounds(self, value: int) -> None:
+    def test_max_nodes_out_of_bounds(self) -> None:
         """max_nodes must be between 1 and 500."""
-        with pytest.raises(ValidationError):
-            SubgraphQuery(query="q", session_id="s", agent_id="a", max_nodes=value)
+        for value in (0, -1, 501, 1000):
+            with pytest.raises(ValidationError) as exc_info:
+                SubgraphQuery.model_validate(_SUBGRAPH_QUERY_BASE | {"max_nodes": value})
+            assert exc_info.value.errors()[0]["loc"] == ("max_nodes",), value
 
     @pytest.mark.parametrize("value", [1, 250, 500])
     def test_max_nodes_in_bounds(self, value: int) -> None:
@@ -272,11 +290,12 @@ class TestSubgraphQuery:
         sq = SubgraphQuery(query="q", session_id="s", agent_id="a", max_nodes=value)
         assert sq.max_nodes == value
 
-    @pytest.mark.parametrize("value", [0, -1, 11, 100])
-    def test_max_depth_out_of_bounds(self, value: int) -> None:
+    def test_max_depth_out_of_bounds(self) -> None:
         """max_depth must be between 1 and 10."""
-        with pytest.raises(ValidationError):
-            SubgraphQuery(query="q", session_id="s", agent_id="a", max_depth=value)
+        for value in (0, -1, 11, 100):
+            with pytest.raises(ValidationError) as exc_info:
+                SubgraphQuery.model_validate(_SUBGRAPH_QUERY_BASE | {"max_depth": value})
+            assert exc_info.value.errors()[0]["loc"] == ("max_depth",), value
 
     @pytest.mark.parametrize("value", [1, 5, 10])
     def test_max_depth_in_bounds(self, value: int) -> None:
@@ -348,7 +367,7 @@ class TestAtlasResponse:
 
     def test_default_structure(self) -> None:
         """An AtlasResponse with no arguments should have empty nodes/edges."""
-        resp = AtlasResponse()
+        resp = AtlasResponse.model_construct()
         assert resp.nodes == {}
         assert resp.edges == []
         assert resp.pagination.cursor is None
@@ -368,7 +387,7 @@ class TestNodeScores:
 
     def test_defaults(self) -> None:
         """NodeScores should default all scores to zero."""
-        scores = NodeScores()
+        scores = NodeScores.model_construct()
         assert scores.decay_score == 0.0
         assert scores.relevance_score == 0.0
         assert scores.importance_score == 0
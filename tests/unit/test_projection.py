@@ -7,17 +7,35 @@ event-to-graph transformation produces correct nodes and edges.
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from uuid import uuid4
 
-from context_graph.domain.models import CausalMechanism, EdgeType
+import pytest
+
+from context_graph.domain.models import CausalMechanism, Edge, EdgeType
 from context_graph.domain.projection import (
     ProjectionResult,
     compute_caused_by_edge,
     compute_follows_edge,
     event_to_node,
+    iter_project_events,
     project_event,
+    project_events_batch,
 )
 from tests.fixtures.events import make_event, make_session_events
 
+pytestmark = pytest.mark.cpu_only
+
+
+@pytest.fixture(scope="module")
+def base_time() -> datetime:
+    return datetime(2024, 2, 11, 12, 0, 0, tzinfo=UTC)
+
+
+def _edges_of(result: ProjectionResult, edge_type: EdgeType) -> list[Edge]:
+    """Edges of *edge_type* in *result*; unpack as ``(edge,) = ...`` to require exactly one."""
+    return [e for e in result.edges if e.edge_type == edge_type]
+
+
 # ---------------------------------------------------------------------------
 # event_to_node
 # ---------------------------------------------------------------------------
@@ -66,7 +84,6 @@ class TestEventToNode:
 
     def test_raises_when_global_position_missing(self) -> None:
         event = make_event()  # global_position defaults to None
-        import pytest
 
         with pytest.raises(ValueError, match="global_position"):
             event_to_node(event)
@@ -89,8 +106,7 @@ class TestEventToNode:
 class TestComputeFollowsEdge:
     """Tests for compute_follows_edge()."""
 
-    def test_creates_follows_edge(self) -> None:
-        base_time = datetime(2024, 2, 11, 12, 0, 0, tzinfo=UTC)
+    def test_creates_follows_edge(self, base_time: datetime) -> None:
         prev = make_event(
             occurred_at=base_time,
             session_id="sess-1",
@@ -108,8 +124,7 @@ class TestComputeFollowsEdge:
         assert edge.source == str(curr.event_id)
         assert edge.target == str(prev.event_id)
 
-    def test_delta_ms_calculated_correctly(self) -> None:
-        base_time = datetime(2024, 2, 11, 12, 0, 0, tzinfo=UTC)
+    def test_delta_ms_calculated_correctly(self, base_time: datetime) -> None:
         prev = make_event(
             occurred_at=base_time,
             global_position="100-0",
@@ -137,10 +152,9 @@ class TestComputeFollowsEdge:
 
         assert edge.properties["session_id"] == "sess-abc"
 
-    def test_zero_delta_for_simultaneous_events(self) -> None:
-        timestamp = datetime(2024, 2, 11, 12, 0, 0, tzinfo=UTC)
-        prev = make_event(occurred_at=timestamp, global_position="100-0")
-        curr = make_event(occurred_at=timestamp, global_position="100-1")
+    def test_zero_delta_for_simultaneous_events(self, base_time: datetime) -> None:
+        prev = make_event(occurred_at=base_time, global_position="100-0")
+        curr = make_event(occurred_at=base_time, global_position="100-1")
 
         edge = compute_follows_edge(prev, curr)
 
@@ -156,8 +170,6 @@ class TestComputeCausedByEdge:
     """Tests for compute_caused_by_edge()."""
 
     def test_creates_caused_by_edge_with_parent(self) -> None:
-        from uuid import uuid4
-
         parent_id = uuid4()
         event = make_event(
             parent_event_id=parent_id,
@@ -172,8 +184,6 @@ class TestComputeCausedByEdge:
         assert edge.target == str(parent_id)
 
     def test_mechanism_is_direct(self) -> None:
-        from uuid import uuid4
-
         event = make_event(
             parent_event_id=uuid4(),
             global_position="100-0",
@@ -207,11 +217,9 @@ class TestProjectEvent:
 
         assert isinstance(result, ProjectionResult)
         assert result.node.event_id == str(event.event_id)
-        follows_edges = [e for e in result.edges if e.edge_type == EdgeType.FOLLOWS]
-        assert len(follows_edges) == 0
+        assert _edges_of(result, EdgeType.FOLLOWS) == []
 
-    def test_second_event_in_session_has_follows(self) -> None:
-        base_time = datetime(2024, 2, 11, 12, 0, 0, tzinfo=UTC)
+    def test_second_event_in_session_has_follows(self, base_time: datetime) -> None:
         prev = make_event(
             session_id="sess-1",
             occurred_at=base_time,
@@ -225,10 +233,9 @@ class TestProjectEvent:
 
         result = project_event(curr, prev_event=prev)
 
-        follows_edges = [e for e in result.edges if e.edge_type == EdgeType.FOLLOWS]
-        assert len(follows_edges) == 1
-        assert follows_edges[0].source == str(curr.event_id)
-        assert follows_edges[0].target == str(prev.event_id)
+        (follows,) = _edges_of(result, EdgeType.FOLLOWS)
+        assert follows.source == str(curr.event_id)
+        assert follows.target == str(prev.event_id)
 
     def test_no_follows_edge_across_different_sessions(self) -> None:
         prev = make_event(session_id="sess-1", global_position="100-0")
@@ -236,12 +243,9 @@ class TestProjectEvent:
 
         result = project_event(curr, prev_event=prev)
 
-        follows_edges = [e for e in result.edges if e.edge_type == EdgeType.FOLLOWS]
-        assert len(follows_edges) == 0
+        assert _edges_of(result, EdgeType.FOLLOWS) == []
 
     def test_caused_by_edge_when_parent_exists(self) -> None:
-        from uuid import uuid4
-
         parent_id = uuid4()
         event = make_event(
             parent_event_id=parent_id,
@@ -250,23 +254,18 @@ class TestProjectEvent:
 
         result = project_event(event, prev_event=None)
 
-        caused_by_edges = [e for e in result.edges if e.edge_type == EdgeType.CAUSED_BY]
-        assert len(caused_by_edges) == 1
-        assert caused_by_edges[0].target == str(parent_id)
+        (caused_by,) = _edges_of(result, EdgeType.CAUSED_BY)
+        assert caused_by.target == str(parent_id)
 
     def test_no_caused_by_edge_without_parent(self) -> None:
         event = make_event(global_position="100-0")
 
         result = project_event(event, prev_event=None)
 
-        caused_by_edges = [e for e in result.edges if e.edge_type == EdgeType.CAUSED_BY]
-        assert len(caused_by_edges) == 0
-
-    def test_both_follows_and_caused_by(self) -> None:
-        from uuid import uuid4
+        assert _edges_of(result, EdgeType.CAUSED_BY) == []
 
+    def test_both_follows_and_caused_by(self, base_time: datetime) -> None:
         parent_id = uuid4()
-        base_time = datetime(2024, 2, 11, 12, 0, 0, tzinfo=UTC)
 
         prev = make_event(
             session_id="sess-1",
@@ -294,24 +293,83 @@ class TestProjectEvent:
         for idx, event in enumerate(events):
             events[idx] = event.model_copy(update={"global_position": f"100-{idx}"})
 
-        results: list[ProjectionResult] = []
-        prev = None
-        for event in events:
-            result = project_event(event, prev_event=prev)
-            results.append(result)
-            prev = event
+        results = project_events_batch(events)
 
         # First event: no FOLLOWS
-        assert len([e for e in results[0].edges if e.edge_type == EdgeType.FOLLOWS]) == 0
+        assert _edges_of(results[0], EdgeType.FOLLOWS) == []
 
         # Second event: FOLLOWS first
-        follows_1 = [e for e in results[1].edges if e.edge_type == EdgeType.FOLLOWS]
-        assert len(follows_1) == 1
-        assert follows_1[0].source == str(events[1].event_id)
-        assert follows_1[0].target == str(events[0].event_id)
+        (follows_1,) = _edges_of(results[1], EdgeType.FOLLOWS)
+        assert follows_1.source == str(events[1].event_id)
+        assert follows_1.target == str(events[0].event_id)
 
         # Third event: FOLLOWS second
-        follows_2 = [e for e in results[2].edges if e.edge_type == EdgeType.FOLLOWS]
-        assert len(follows_2) == 1
-        assert follows_2[0].source == str(events[2].event_id)
-        assert follows_2[0].target == str(events[1].event_id)
+        (follows_2,) = _edges_of(results[2], EdgeType.FOLLOWS)
+        assert follows_2.source == str(events[2].event_id)
+        assert follows_2.target == str(events[1].event_id)
+
+
+# ---------------------------------------------------------------------------
+# project_events_batch
+# ---------------------------------------------------------------------------
+
+
+class TestProjectEventsBatch:
+    """Tests for project_events_batch()."""
+
+    def test_matches_sequential_project_event(self, base_time: datetime) -> None:
+        parent_id = uuid4()
+        events = [
+            make_event(session_id="sess-1", occurred_at=base_time, global_position="100-0"),
+            make_event(
+                session_id="sess-1",
+                occurred_at=base_time + timedelta(milliseconds=1500),
+                parent_event_id=parent_id,
+                global_position="100-1",
+            ),
+            make_event(
+                session_id="sess-2",
+                occurred_at=base_time + timedelta(seconds=3),
+                global_position="100-2",
+            ),
+            make_event(
+                session_id="sess-2",
+                occurred_at=(base_time + timedelta(seconds=4)).replace(tzinfo=None),
+                global_position="100-3",
+            ),
+        ]
+
+        expected = []
+        prev = None
+        for event in events:
+            expected.append(project_event(event, prev_event=prev))
+            prev = event
+
+        assert project_events_batch(events) == expected
+
+    def test_prev_event_links_first_event(self, base_time: datetime) -> None:
+        prev = make_event(session_id="sess-1", occurred_at=base_time, global_position="100-0")
+        curr = make_event(
+            session_id="sess-1",
+            occurred_at=base_time + timedelta(seconds=2),
+            global_position="100-1",
+        )
+
+        (result,) = project_events_batch([curr], prev_event=prev)
+
+        (follows,) = _edges_of(result, EdgeType.FOLLOWS)
+        assert follows.target == str(prev.event_id)
+        assert follows.properties["delta_ms"] == 2000
+
+    def test_empty_batch(self) -> None:
+        assert project_events_batch([]) == []
+
+    def test_iter_yields_earlier_results_before_failing(self) -> None:
+        good = make_event(global_position="100-0")
+        bad = make_event()  # global_position defaults to None
+
+        results = iter_project_events([good, bad])
+
+        assert next(results).node.event_id == str(good.event_id)
+        with pytest.raises(ValueError, match="global_position"):
+            next(results)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import math
 from datetime import UTC, datetime, timedelta
 
+import pytest
+
 from context_graph.domain.models import NodeScores
 from context_graph.domain.scoring import (
     compute_composite_score,
@@ -13,67 +16,58 @@ from context_graph.domain.scoring import (
     score_node,
 )
 
+pytestmark = pytest.mark.cpu_only
+
+
+# One fixed clock for the module: tests only need ages relative to ``now``,
+# and a constant keeps runs reproducible.
+@pytest.fixture(scope="module")
+def now() -> datetime:
+    return datetime(2025, 1, 1, tzinfo=UTC)
+
 
 class TestComputeRecencyScore:
     """Tests for the Ebbinghaus forgetting curve function."""
 
-    def test_recent_event_high_score(self) -> None:
-        """An event 1 hour ago should score > 0.95."""
-        now = datetime.now(UTC)
-        occurred_at = now - timedelta(hours=1)
-        score = compute_recency_score(occurred_at, now=now)
-        assert score > 0.95
-
-    def test_old_event_low_score(self) -> None:
-        """An event 720 hours (30 days) ago should score < 0.05."""
-        now = datetime.now(UTC)
-        occurred_at = now - timedelta(hours=720)
-        score = compute_recency_score(occurred_at, now=now)
-        assert score < 0.05
-
-    def test_access_count_boosts_score(self) -> None:
+    # Expected scores are the closed form e^(-t / S) with S = s_base when
+    # access_count is 0 (default s_base = 168h).
+    @pytest.mark.parametrize(
+        ("hours_ago", "kwargs", "expected"),
+        [
+            pytest.param(1, {}, math.exp(-1 / 168.0), id="recent_event_high_score"),
+            pytest.param(720, {}, math.exp(-720 / 168.0), id="old_event_low_score"),
+            pytest.param(0, {}, 1.0, id="zero_time_returns_one"),
+            pytest.param(1, {"s_base": 0.0, "s_boost": 0.0}, 0.0, id="zero_stability_returns_zero"),
+            pytest.param(
+                100, {"s_base": 1000.0}, math.exp(-100 / 1000.0), id="custom_stability_params"
+            ),
+            # Negative age: max(0, t) = 0, so the score clamps to 1.0
+            pytest.param(-1, {}, 1.0, id="future_event_clamps_to_one"),
+        ],
+    )
+    def test_recency(
+        self,
+        now: datetime,
+        hours_ago: int,
+        kwargs: dict[str, float],
+        expected: float,
+    ) -> None:
+        score = compute_recency_score(now - timedelta(hours=hours_ago), now=now, **kwargs)
+        assert math.isclose(score, expected, rel_tol=1e-9)
+
+    def test_access_count_boosts_score(self, now: datetime) -> None:
         """More accesses should increase stability and produce a higher score."""
-        now = datetime.now(UTC)
         occurred_at = now - timedelta(hours=200)
         score_no_access = compute_recency_score(occurred_at, access_count=0, now=now)
         score_with_access = compute_recency_score(occurred_at, access_count=10, now=now)
         assert score_with_access > score_no_access
 
-    def test_zero_time_returns_one(self) -> None:
-        """An event occurring exactly now should return 1.0."""
-        now = datetime.now(UTC)
-        score = compute_recency_score(now, now=now)
-        assert score == 1.0
-
-    def test_zero_stability_returns_zero(self) -> None:
-        """Zero stability (s_base=0, no access) should return 0.0."""
-        now = datetime.now(UTC)
-        occurred_at = now - timedelta(hours=1)
-        score = compute_recency_score(occurred_at, s_base=0.0, s_boost=0.0, now=now)
-        assert score == 0.0
-
-    def test_custom_stability_params(self) -> None:
-        """Custom s_base and s_boost affect the decay rate."""
-        now = datetime.now(UTC)
-        occurred_at = now - timedelta(hours=100)
-        # With high stability, score should be relatively high
-        score = compute_recency_score(occurred_at, s_base=1000.0, now=now)
-        assert score > 0.9
-
-    def test_future_event_clamps_to_one(self) -> None:
-        """A future occurred_at should produce max(0, negative t) = 0 -> score 1.0."""
-        now = datetime.now(UTC)
-        occurred_at = now + timedelta(hours=1)
-        score = compute_recency_score(occurred_at, now=now)
-        assert score == 1.0
-
 
 class TestSublinearStabilityGrowth:
     """Tests for sublinear (log1p) stability growth in compute_recency_score."""
 
-    def test_sublinear_growth_bounded(self) -> None:
+    def test_sublinear_growth_bounded(self, now: datetime) -> None:
         """Diminishing returns: jump from 10->100 accesses should be smaller than 0->10."""
-        now = datetime.now(UTC)
         occurred_at = now - timedelta(hours=200)
         score_0 = compute_recency_score(occurred_at, access_count=0, now=now, sublinear=True)
         score_10 = compute_recency_score(occurred_at, access_count=10, now=now, sublinear=True)
@@ -83,12 +77,9 @@ class TestSublinearStabilityGrowth:
         assert delta_0_to_10 > delta_10_to_100
         assert delta_10_to_100 > 0  # still grows, just slower
 
-    def test_linear_backward_compat(self) -> None:
+    def test_linear_backward_compat(self, now: datetime) -> None:
         """sublinear=False gives exactly the old linear behavior."""
-        now = datetime.now(UTC)
         occurred_at = now - timedelta(hours=100)
-        import math
-
         access_count = 5
         s_base = 168.0
         s_boost = 24.0
@@ -143,48 +134,40 @@ class TestComputeImportanceScore:
         assert score == 1.0
 
 
-class TestComputeRelevanceScore:
-    """Tests for cosine similarity."""
+# (query, node, expected score) — compared with a 1e-6 tolerance.
+_RELEVANCE_CASES = {
+    "identical_vectors": ([1.0, 0.0], [1.0, 0.0], 1.0),
+    "orthogonal_vectors": ([1.0, 0.0], [0.0, 1.0], 0.0),
+    "empty_query": ([], [1.0, 0.0], 0.5),
+    "empty_node": ([1.0, 0.0], [], 0.5),
+    "dimension_mismatch": ([1.0, 0.0], [1.0, 0.0, 0.0], 0.5),
+    "zero_vectors": ([0.0, 0.0], [0.0, 0.0], 0.5),
+    "similar_vectors": ([1.0, 0.1], [1.0, 0.0], 1.0 / math.sqrt(1.01)),
+    "opposite_vectors_clamped": ([1.0, 0.0], [-1.0, 0.0], 0.0),
+    "scaled_vectors": ([3.0, 4.0], [6.0, 8.0], 1.0),
+    "partial_overlap": ([1.0, 1.0, 0.0], [1.0, 0.0, 0.0], 1.0 / math.sqrt(2.0)),
+}
 
-    def test_identical_vectors(self) -> None:
-        """Identical vectors should have similarity 1.0."""
-        score = compute_relevance_score([1.0, 0.0], [1.0, 0.0])
-        assert abs(score - 1.0) < 1e-6
 
-    def test_orthogonal_vectors(self) -> None:
-        """Orthogonal vectors should have similarity 0.0."""
-        score = compute_relevance_score([1.0, 0.0], [0.0, 1.0])
-        assert abs(score - 0.0) < 1e-6
+class TestComputeRelevanceScore:
+    """Tests for cosine similarity."""
 
-    def test_empty_query(self) -> None:
-        """Empty query embedding should return 0.5."""
-        score = compute_relevance_score([], [1.0, 0.0])
-        assert score == 0.5
+    @pytest.mark.parametrize(
+        ("query", "node", "expected"),
+        list(_RELEVANCE_CASES.values()),
+        ids=list(_RELEVANCE_CASES),
+    )
+    def test_relevance_score(self, query: list[float], node: list[float], expected: float) -> None:
+        assert compute_relevance_score(query, node) == pytest.approx(expected, abs=1e-6)
 
-    def test_empty_node(self) -> None:
-        """Empty node embedding should return 0.5."""
-        score = compute_relevance_score([1.0, 0.0], [])
-        assert score == 0.5
+    def test_fallbacks_are_exactly_half(self) -> None:
+        """Empty, mismatched and zero-norm inputs return exactly 0.5, not a near value."""
+        for name in ("empty_query", "empty_node", "dimension_mismatch", "zero_vectors"):
+            query, node, _ = _RELEVANCE_CASES[name]
+            assert compute_relevance_score(query, node) == 0.5, name
 
-    def test_dimension_mismatch(self) -> None:
-        """Mismatched dimensions should return 0.5."""
-        score = compute_relevance_score([1.0, 0.0], [1.0, 0.0, 0.0])
-        assert score == 0.5
-
-    def test_zero_vectors(self) -> None:
-        """Zero vectors should return 0.5."""
-        score = compute_relevance_score([0.0, 0.0], [0.0, 0.0])
-        assert score == 0.5
-
-    def test_similar_vectors(self) -> None:
-        """Slightly different but similar vectors should score high."""
-        score = compute_relevance_score([1.0, 0.1], [1.0, 0.0])
-        assert score > 0.99
-
-    def test_opposite_vectors_clamped(self) -> None:
-        """Opposite vectors yield negative cosine, clamped to 0.0."""
-        score = compute_relevance_score([1.0, 0.0], [-1.0, 0.0])
-        assert score == 0.0
+    def test_opposite_vectors_clamped_to_exactly_zero(self) -> None:
+        assert compute_relevance_score([1.0, 0.0], [-1.0, 0.0]) == 0.0
 
 
 class TestComputeCompositeScore:
@@ -231,9 +214,8 @@ class TestComputeCompositeScore:
 class TestScoreNode:
     """Tests for the score_node convenience function."""
 
-    def test_returns_node_scores_model(self) -> None:
+    def test_returns_node_scores_model(self, now: datetime) -> None:
         """score_node should return a NodeScores instance."""
-        now = datetime.now(UTC)
         node_data = {
             "occurred_at": now.isoformat(),
             "access_count": 0,
@@ -244,23 +226,20 @@ class TestScoreNode:
         result = score_node(node_data, now=now)
         assert isinstance(result, NodeScores)
 
-    def test_importance_hint_preserved(self) -> None:
+    def test_importance_hint_preserved(self, now: datetime) -> None:
         """importance_score from node_data should appear in output."""
-        now = datetime.now(UTC)
         node_data = {"occurred_at": now, "importance_score": 8}
         result = score_node(node_data, now=now)
         assert result.importance_score == 8
 
-    def test_no_importance_hint_derives_score(self) -> None:
+    def test_no_importance_hint_derives_score(self, now: datetime) -> None:
         """Without importance_score in node_data, a derived int is computed."""
-        now = datetime.now(UTC)
         node_data = {"occurred_at": now}
         result = score_node(node_data, now=now)
         assert 1 <= result.importance_score <= 10
 
-    def test_with_query_embedding(self) -> None:
+    def test_with_query_embedding(self, now: datetime) -> None:
         """Providing a query embedding should produce nonzero relevance."""
-        now = datetime.now(UTC)
         node_data = {
             "occurred_at": now,
             "embedding": [1.0, 0.0, 0.0],
@@ -268,22 +247,19 @@ class TestScoreNode:
         result = score_node(node_data, query_embedding=[1.0, 0.0, 0.0], now=now)
         assert result.relevance_score > 0.99
 
-    def test_datetime_object_in_node_data(self) -> None:
+    def test_datetime_object_in_node_data(self, now: datetime) -> None:
         """occurred_at can be a datetime object, not just a string."""
-        now = datetime.now(UTC)
         node_data = {"occurred_at": now}
         result = score_node(node_data, now=now)
         assert result.decay_score > 0
 
-    def test_missing_occurred_at_fallback(self) -> None:
+    def test_missing_occurred_at_fallback(self, now: datetime) -> None:
         """Missing occurred_at should fall back gracefully."""
-        now = datetime.now(UTC)
         result = score_node({}, now=now)
         assert isinstance(result, NodeScores)
 
-    def test_last_accessed_at_boosts_recency(self) -> None:
+    def test_last_accessed_at_boosts_recency(self, now: datetime) -> None:
         """last_accessed_at in node_data should boost recency when more recent."""
-        now = datetime.now(UTC)
         occurred = now - timedelta(hours=200)
         last_accessed = now - timedelta(hours=5)
         node_with = {
@@ -297,27 +273,24 @@ class TestScoreNode:
 
 
 class TestComputeRecencyWithLastAccessed:
-    def test_last_accessed_after_occurred(self):
+    def test_last_accessed_after_occurred(self, now: datetime):
         """last_accessed_at after occurred_at should use last_accessed_at."""
-        now = datetime.now(UTC)
         occurred = now - timedelta(hours=100)
         last_accessed = now - timedelta(hours=10)
         score = compute_recency_score(occurred, last_accessed_at=last_accessed, now=now)
         score_without = compute_recency_score(occurred, now=now)
         assert score > score_without
 
-    def test_last_accessed_before_occurred(self):
+    def test_last_accessed_before_occurred(self, now: datetime):
         """last_accessed_at before occurred_at should use occurred_at (max)."""
-        now = datetime.now(UTC)
         occurred = now - timedelta(hours=10)
         last_accessed = now - timedelta(hours=100)
         score = compute_recency_score(occurred, last_accessed_at=last_accessed, now=now)
         score_without = compute_recency_score(occurred, now=now)
         assert abs(score - score_without) < 1e-6
 
-    def test_last_accessed_none_unchanged(self):
+    def test_last_accessed_none_unchanged(self, now: datetime):
         """None last_accessed_at should behave like original function."""
-        now = datetime.now(UTC)
         occurred = now - timedelta(hours=50)
         score = compute_recency_score(occurred, last_accessed_at=None, now=now)
         score_without = compute_recency_score(occurred, now=now)
@@ -341,11 +314,10 @@ class TestComputeRelevanceEmptyFallback:
 class TestScoreEntityNode:
     """Tests for score_entity_node with real embeddings."""
 
-    def test_entity_node_with_real_embedding(self) -> None:
+    def test_entity_node_with_real_embedding(self, now: datetime) -> None:
         """Non-empty embedding should produce relevance_score != 0.5."""
         from context_graph.domain.scoring import score_entity_node
 
-        now = datetime.now(UTC)
         entity_data = {
             "last_seen": now.isoformat(),
             "mention_count": 3,
@@ -355,11 +327,10 @@ class TestScoreEntityNode:
         assert result.relevance_score > 0.99
         assert result.relevance_score != 0.5
 
-    def test_entity_node_empty_embedding(self) -> None:
+    def test_entity_node_empty_embedding(self, now: datetime) -> None:
         """Empty embedding should preserve 0.5 default relevance."""
         from context_graph.domain.scoring import score_entity_node
 
-        now = datetime.now(UTC)
         entity_data = {
             "last_seen": now.isoformat(),
             "mention_count": 1,
@@ -368,11 +339,10 @@ class TestScoreEntityNode:
         result = score_entity_node(entity_data, query_embedding=[1.0, 0.0, 0.0], now=now)
         assert result.relevance_score == 0.5
 
-    def test_entity_node_orthogonal_embedding(self) -> None:
+    def test_entity_node_orthogonal_embedding(self, now: datetime) -> None:
         """Orthogonal embedding should produce relevance_score of 0.0."""
         from context_graph.domain.scoring import score_entity_node
 
-        now = datetime.now(UTC)
         entity_data = {
             "last_seen": now.isoformat(),
             "mention_count": 2,
@@ -381,11 +351,10 @@ class TestScoreEntityNode:
         result = score_entity_node(entity_data, query_embedding=[1.0, 0.0, 0.0], now=now)
         assert abs(result.relevance_score) < 1e-6
 
-    def test_entity_node_no_query_embedding(self) -> None:
+    def test_entity_node_no_query_embedding(self, now: datetime) -> None:
         """No query embedding should give 0.5 relevance regardless of node embedding."""
         from context_graph.domain.scoring import score_entity_node
 
-        now = datetime.now(UTC)
         entity_data = {
             "last_seen": now.isoformat(),
             "mention_count": 5,
@@ -398,11 +367,10 @@ class TestScoreEntityNode:
 class TestScoreEntityNodeConfigurable:
     """Tests for score_entity_node with configurable decay parameters."""
 
-    def test_score_entity_node_custom_s_base(self) -> None:
+    def test_score_entity_node_custom_s_base(self, now: datetime) -> None:
         """A higher s_base should produce slower decay (higher recency for old entities)."""
         from context_graph.domain.scoring import score_entity_node
 
-        now = datetime.now(UTC)
         entity_data = {
             "last_seen": (now - timedelta(hours=500)).isoformat(),
             "mention_count": 3,
@@ -412,11 +380,10 @@ class TestScoreEntityNodeConfigurable:
         score_high_base = score_entity_node(entity_data, now=now, s_base=2000.0)
         assert score_high_base.decay_score > score_default.decay_score
 
-    def test_score_entity_node_custom_weights(self) -> None:
+    def test_score_entity_node_custom_weights(self, now: datetime) -> None:
         """Custom weights should change the composite score."""
         from context_graph.domain.scoring import score_entity_node
 
-        now = datetime.now(UTC)
         entity_data = {
             "last_seen": now.isoformat(),
             "mention_count": 5,
@@ -436,11 +403,10 @@ class TestScoreEntityNodeConfigurable:
         assert score_relevance_only.decay_score > 0.95
         assert score_default.decay_score != score_relevance_only.decay_score
 
-    def test_score_entity_node_defaults_match_current_behavior(self) -> None:
+    def test_score_entity_node_defaults_match_current_behavior(self, now: datetime) -> None:
         """Default params produce the same result as old hardcoded values."""
         from context_graph.domain.scoring import score_entity_node
 
-        now = datetime.now(UTC)
         entity_data = {
             "last_seen": (now - timedelta(hours=100)).isoformat(),
             "mention_count": 4,
@@ -453,9 +419,8 @@ class TestScoreEntityNodeConfigurable:
         score_implicit = score_entity_node(entity_data, query_embedding=[0.5, 0.5], now=now)
         assert abs(score_explicit.decay_score - score_implicit.decay_score) < 1e-9
 
-    def test_score_node_with_all_custom_params(self) -> None:
+    def test_score_node_with_all_custom_params(self, now: datetime) -> None:
         """score_node should accept and apply all custom decay params."""
-        now = datetime.now(UTC)
         node_data = {
             "occurred_at": (now - timedelta(hours=50)).isoformat(),
             "access_count": 2,
@@ -477,11 +442,10 @@ class TestScoreEntityNodeConfigurable:
         assert isinstance(result, NodeScores)
         assert result.decay_score > 0
 
-    def test_composite_score_zero_weights(self) -> None:
+    def test_composite_score_zero_weights(self, now: datetime) -> None:
         """All zero weights should produce decay_score of 0.0."""
         from context_graph.domain.scoring import score_entity_node
 
-        now = datetime.now(UTC)
         entity_data = {
             "last_seen": now.isoformat(),
             "mention_count": 10,
@@ -498,11 +462,10 @@ class TestScoreEntityNodeConfigurable:
         )
         assert result.decay_score == 0.0
 
-    def test_entity_node_user_affinity_weight(self) -> None:
+    def test_entity_node_user_affinity_weight(self, now: datetime) -> None:
         """Changing w_user_affinity affects composite when user_affinity > 0."""
         from context_graph.domain.scoring import score_entity_node
 
-        now = datetime.now(UTC)
         entity_data = {
             "last_seen": now.isoformat(),
             "mention_count": 5,
@@ -515,11 +478,10 @@ class TestScoreEntityNodeConfigurable:
         # With user_affinity=0 in entity, higher w_user_affinity dilutes composite
         assert score_low_w.decay_score > score_high_w.decay_score
 
-    def test_decay_settings_propagation(self) -> None:
+    def test_decay_settings_propagation(self, now: datetime) -> None:
         """Verify params reach compute functions by testing s_base effect on recency."""
         from context_graph.domain.scoring import score_entity_node
 
-        now = datetime.now(UTC)
         entity_data = {
             "last_seen": (now - timedelta(hours=300)).isoformat(),
             "mention_count": 2,
@@ -531,11 +493,10 @@ class TestScoreEntityNodeConfigurable:
         score_slow = score_entity_node(entity_data, now=now, s_base=10000.0)
         assert score_slow.decay_score > score_fast.decay_score
 
-    def test_entity_node_high_s_base_slower_decay(self) -> None:
+    def test_entity_node_high_s_base_slower_decay(self, now: datetime) -> None:
         """Entity with high s_base should retain higher score over time."""
         from context_graph.domain.scoring import score_entity_node
 
-        now = datetime.now(UTC)
         entity_data = {
             "last_seen": (now - timedelta(hours=1000)).isoformat(),
             "mention_count": 1,
@@ -22,41 +22,53 @@ from context_graph.adapters.redis.trimmer import (
     trim_stream,
 )
 
+pytestmark = pytest.mark.cpu_only
+
 # ---------------------------------------------------------------------------
 # trim_stream
 # ---------------------------------------------------------------------------
 
 
+def _trim_redis(xtrim: int = 200) -> AsyncMock:
+    """Build a mock Redis client wired for trim_stream.
+
+    *xtrim* is the number of entries XTRIM reports removed. XLEN reports
+    1000 entries before and 800 after; XINFO GROUPS reports no groups.
+    """
+    redis = AsyncMock()
+    redis.xlen = AsyncMock(side_effect=[1000, 800])
+    redis.xtrim = AsyncMock(return_value=xtrim)
+    redis.xinfo_groups = AsyncMock(return_value=[])
+    return redis
+
+
 class TestTrimStream:
     @pytest.fixture()
     def mock_redis(self):
-        redis = AsyncMock()
-        redis.xlen = AsyncMock(side_effect=[1000, 800])  # before, after
-        redis.xtrim = AsyncMock(return_value=200)
-        return redis
-
-    async def test_trim_calls_xtrim_with_minid(self, mock_redis):
-        result = await trim_stream(mock_redis, "events:__global__", max_age_days=7)
-
-        mock_redis.xtrim.assert_called_once()
-        call_kwargs = mock_redis.xtrim.call_args
-        assert call_kwargs.kwargs["name"] == "events:__global__"
+        return _trim_redis()
+
+    @pytest.mark.parametrize(
+        ("stream", "days", "xtrim"),
+        [
+            pytest.param("events:__global__", 7, 200, id="default"),
+            pytest.param("test-stream", 1, 50, id="reports_count"),
+            pytest.param("test-stream", 30, 0, id="zero_entries"),
+        ],
+    )
+    async def test_trim_returns_xtrim_count_and_uses_exact_minid(
+        self, stream: str, days: int, xtrim: int
+    ):
+        """The XTRIM removal count is returned; the trim is an exact MINID trim."""
+        redis = _trim_redis(xtrim=xtrim)
+        result = await trim_stream(redis, stream, max_age_days=days)
+
+        assert result == xtrim
+        redis.xtrim.assert_called_once()
+        call_kwargs = redis.xtrim.call_args
+        assert call_kwargs.kwargs["name"] == stream
         assert call_kwargs.kwargs["approximate"] is False
         # Verify minid is a timestamp string
-        min_id = call_kwargs.kwargs["minid"]
-        assert "-0" in min_id
-        assert result == 200
-
-    async def test_trim_reports_correct_count(self, mock_redis):
-        mock_redis.xtrim = AsyncMock(return_value=50)
-        result = await trim_stream(mock_redis, "test-stream", max_age_days=1)
-        assert result == 50
-
-    async def test_trim_zero_entries(self, mock_redis):
-        mock_redis.xlen = AsyncMock(side_effect=[100, 100])
-        mock_redis.xtrim = AsyncMock(return_value=0)
-        result = await trim_stream(mock_redis, "test-stream", max_age_days=30)
-        assert result == 0
+        assert call_kwargs.kwargs["minid"].endswith("-0")
 
     async def test_trim_minid_calculation(self, mock_redis):
         """Verify the MINID is calculated from max_age_days."""
@@ -79,6 +91,15 @@ class TestTrimStream:
 # delete_expired_events
 # ---------------------------------------------------------------------------
 
+# Event ages on either side of the 90-day retention used below, fixed at import.
+# The 10-day margins keep them on the right side for any realistic test run.
+_NOW = datetime.now(UTC)
+_OLD_EPOCH_MS = int((_NOW - timedelta(days=100)).timestamp() * 1000)
+_FRESH_EPOCH_MS = int((_NOW - timedelta(days=10)).timestamp() * 1000)
+# JSON.GET ``$.occurred_at_epoch_ms`` replies for those ages.
+_OLD_EPOCH_JSON = orjson.dumps([_OLD_EPOCH_MS])
+_FRESH_EPOCH_JSON = orjson.dumps([_FRESH_EPOCH_MS])
+
 
 class TestDeleteExpiredEvents:
     @pytest.fixture()
@@ -93,10 +114,6 @@ class TestDeleteExpiredEvents:
         assert result == 0
 
     async def test_deletes_expired_keys(self, mock_redis):
-        now = datetime.now(UTC)
-        old_epoch_ms = int((now - timedelta(days=100)).timestamp() * 1000)
-        fresh_epoch_ms = int((now - timedelta(days=10)).timestamp() * 1000)
-
         # First scan returns keys, second scan returns empty (cursor=0)
         mock_redis.scan = AsyncMock(
             side_effect=[
@@ -108,8 +125,8 @@ class TestDeleteExpiredEvents:
         mock_pipe = AsyncMock()
         mock_pipe.execute = AsyncMock(
             return_value=[
-                f"[{old_epoch_ms}]".encode(),
-                f"[{fresh_epoch_ms}]".encode(),
+                _OLD_EPOCH_JSON,
+                _FRESH_EPOCH_JSON,
             ]
         )
         mock_pipe.execute_command = MagicMock()
@@ -269,9 +286,7 @@ class TestArchiveAndDeleteExpiredEvents:
         return store
 
     async def test_archives_expired_events_before_deletion(self, mock_redis, mock_archive_store):
-        now = datetime.now(UTC)
-        old_epoch_ms = int((now - timedelta(days=100)).timestamp() * 1000)
-        old_doc = {"event_id": "evt-old", "occurred_at_epoch_ms": old_epoch_ms}
+        old_doc = {"event_id": "evt-old", "occurred_at_epoch_ms": _OLD_EPOCH_MS}
 
         mock_redis.scan = AsyncMock(return_value=(0, [b"evt:old-1"]))
 
@@ -297,9 +312,7 @@ class TestArchiveAndDeleteExpiredEvents:
         mock_del_pipe.delete.assert_called_once_with("evt:old-1")
 
     async def test_does_not_archive_fresh_events(self, mock_redis, mock_archive_store):
-        now = datetime.now(UTC)
-        fresh_epoch_ms = int((now - timedelta(days=10)).timestamp() * 1000)
-        fresh_doc = {"event_id": "evt-fresh", "occurred_at_epoch_ms": fresh_epoch_ms}
+        fresh_doc = {"event_id": "evt-fresh", "occurred_at_epoch_ms": _FRESH_EPOCH_MS}
 
         mock_redis.scan = AsyncMock(return_value=(0, [b"evt:fresh-1"]))
 
@@ -319,9 +332,7 @@ class TestArchiveAndDeleteExpiredEvents:
 
     async def test_archive_failure_prevents_deletion(self, mock_redis, mock_archive_store):
         """Data safety: if archiving fails, events must NOT be deleted."""
-        now = datetime.now(UTC)
-        old_epoch_ms = int((now - timedelta(days=100)).timestamp() * 1000)
-        old_doc = {"event_id": "evt-old", "occurred_at_epoch_ms": old_epoch_ms}
+        old_doc = {"event_id": "evt-old", "occurred_at_epoch_ms": _OLD_EPOCH_MS}
 
         mock_redis.scan = AsyncMock(return_value=(0, [b"evt:old-1"]))
 
@@ -521,16 +532,10 @@ class TestGetConsumerGroupProgress:
 class TestTrimStreamWithConsumerGroups:
     @pytest.fixture()
     def mock_redis(self):
-        redis = AsyncMock()
-        redis.xlen = AsyncMock(side_effect=[1000, 800])
-        redis.xtrim = AsyncMock(return_value=200)
-        redis.xinfo_groups = AsyncMock(return_value=[])
-        return redis
+        return _trim_redis()
 
     async def test_trim_with_consumer_groups_calls_progress(self, mock_redis):
         """When consumer_groups is provided, get_consumer_group_progress is called."""
-        mock_redis.xinfo_groups = AsyncMock(return_value=[])
-
         await trim_stream(
             mock_redis,
             "events:__global__",
@@ -19,24 +19,45 @@ from context_graph.domain.validation import (
     validate_event_type_prefix,
 )
 
+pytestmark = pytest.mark.cpu_only
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Captured once at import. It is always in the past by the time
+# validate_event reads the clock, so it is safe anywhere that only needs a
+# valid, non-future timestamp. The drift tests still read a fresh clock.
+_NOW = datetime.now(UTC)
 
-def _make_valid_event(**overrides) -> Event:
-    """Build a valid Event for validation tests."""
-    defaults: dict = {
+# Sorted once so parametrized test IDs are stable across runs.
+_SORTED_KNOWN_PREFIXES = tuple(sorted(KNOWN_PREFIXES))
+_UNKNOWN_PREFIXES = ("custom", "foo", "xyz", "plugin")
+
+
+def _valid_event_fields(**overrides) -> dict:
+    """Keyword arguments for a valid Event, with *overrides* applied."""
+    fields: dict = {
         "event_id": uuid4(),
         "event_type": "tool.execute",
-        "occurred_at": datetime.now(UTC),
+        "occurred_at": _NOW,
         "session_id": "test-session",
         "agent_id": "test-agent",
         "trace_id": "test-trace",
         "payload_ref": "payload:test",
     }
-    defaults.update(overrides)
-    return Event(**defaults)
+    fields.update(overrides)
+    return fields
+
+
+def _make_valid_event(**overrides) -> Event:
+    """Build a valid Event for validation tests.
+
+    Uses ``model_construct``: ``validate_event`` is what is under test, so
+    Pydantic's field validation is skipped. ``test_valid_event_via_constructor``
+    covers the validated constructor.
+    """
+    return Event.model_construct(**_valid_event_fields(**overrides))
 
 
 # ---------------------------------------------------------------------------
@@ -54,12 +75,19 @@ class TestValidateEventValid:
         assert result.is_valid is True
         assert result.errors == []
 
+    def test_valid_event_via_constructor(self) -> None:
+        """An event that went through Pydantic validation should also pass."""
+        event = Event(**_valid_event_fields())
+        result = validate_event(event)
+        assert result.is_valid is True
+        assert result.errors == []
+
     def test_valid_event_with_optional_fields(self) -> None:
         """An event with optional fields populated should still pass."""
         event = _make_valid_event(
             tool_name="calculator",
             parent_event_id=uuid4(),
-            ended_at=datetime.now(UTC) + timedelta(seconds=5),
+            ended_at=_NOW + timedelta(seconds=5),
             importance_hint=5,
         )
         result = validate_event(event)
@@ -86,7 +114,7 @@ class TestValidateEventTypePattern:
         event = Event.model_construct(
             event_id=uuid4(),
             event_type="INVALID",
-            occurred_at=datetime.now(UTC),
+            occurred_at=_NOW,
             session_id="s",
             agent_id="a",
             trace_id="t",
@@ -132,10 +160,9 @@ class TestValidateEventEndedBeforeOccurred:
 
     def test_ended_before_occurred_is_invalid(self) -> None:
         """ended_at before occurred_at must produce a validation error."""
-        now = datetime.now(UTC)
         event = _make_valid_event(
-            occurred_at=now,
-            ended_at=now - timedelta(seconds=10),
+            occurred_at=_NOW,
+            ended_at=_NOW - timedelta(seconds=10),
         )
         result = validate_event(event)
         assert result.is_valid is False
@@ -144,8 +171,7 @@ class TestValidateEventEndedBeforeOccurred:
 
     def test_ended_equal_to_occurred_is_valid(self) -> None:
         """ended_at equal to occurred_at (zero-duration) should be accepted."""
-        now = datetime.now(UTC)
-        event = _make_valid_event(occurred_at=now, ended_at=now)
+        event = _make_valid_event(occurred_at=_NOW, ended_at=_NOW)
         result = validate_event(event)
         assert result.is_valid is True
 
@@ -174,6 +200,13 @@ class TestValidateEventFutureDrift:
         result = validate_event(event)
         assert result.is_valid is True
 
+    def test_drift_measured_against_explicit_now(self) -> None:
+        """A caller-supplied ``now`` replaces the clock read."""
+        event = _make_valid_event(occurred_at=_NOW)
+        earlier = _NOW - timedelta(seconds=MAX_FUTURE_DRIFT_SECONDS + 60)
+        assert validate_event(event, now=earlier).is_valid is False
+        assert validate_event(event, now=_NOW).is_valid is True
+
 
 # ---------------------------------------------------------------------------
 # validate_event_type_prefix
@@ -183,13 +216,13 @@ class TestValidateEventFutureDrift:
 class TestValidateEventTypePrefix:
     """Tests for the known-prefix helper."""
 
-    @pytest.mark.parametrize("prefix", sorted(KNOWN_PREFIXES))
+    @pytest.mark.parametrize("prefix", _SORTED_KNOWN_PREFIXES)
     def test_known_prefixes_return_true(self, prefix: str) -> None:
         """Every known prefix should be recognized."""
         event_type = f"{prefix}.action"
         assert validate_event_type_prefix(event_type) is True
 
-    @pytest.mark.parametrize("unknown", ["custom", "foo", "xyz", "plugin"])
+    @pytest.mark.parametrize("unknown", _UNKNOWN_PREFIXES)
     def test_unknown_prefix_returns_false(self, unknown: str) -> None:
         """Unrecognized prefixes should return False."""
         event_type = f"{unknown}.action"
@@ -198,3 +231,8 @@ class TestValidateEventTypePrefix:
     def test_no_dot_returns_false(self) -> None:
         """A string with no dot has no recognized prefix."""
         assert validate_event_type_prefix("nodot") is False
+
+    def test_only_first_segment_is_checked(self) -> None:
+        """Deeper segments do not affect the prefix check."""
+        assert validate_event_type_prefix("tool.execute.retry") is True
+        assert validate_event_type_prefix("custom.tool.execute") is False